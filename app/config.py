@@ -35,6 +35,9 @@ AUTH_RECORD_PATH = BASE_DIR / "auth_records" / "auth_record.json"
 DELTA_CACHE_DIR = BASE_DIR / "cache" / "delta_tokens"
 DELTA_CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
+# Compiled Jinja template bytecode cache
+TEMPLATE_CACHE_DIR = BASE_DIR / "cache" / "templates"
+
 
 def validate_config() -> None:
     """Validate that required configuration is present"""
@@ -147,3 +147,12 @@ Draft created: **{{ draft.subject }}**
 {% endif %}\
 {% if draft.webLink %}- **Link**: {{ draft.webLink }}
 {% endif %}"""
+
+# All defaults, compiled up front by the service factory
+DEFAULT_TEMPLATES = (
+    GET_EVENTS,
+    CREATE_EVENT,
+    FIND_MEETING_TIMES,
+    GET_EMAILS,
+    CREATE_DRAFT,
+)
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from typing import Optional
 
+from app.config import TEMPLATE_CACHE_DIR
+from app.mcp import default_templates
 from app.services.auth_service import AuthService
 from app.services.availability_service import AvailabilityService
 from app.services.calendar_service import CalendarService
@@ -71,7 +73,11 @@ class ServiceFactory:
     def get_template_service(self) -> TemplateService:
         """Get or create TemplateService singleton."""
         if self._template_service is None:
-            self._template_service = TemplateService()
+            self._template_service = TemplateService(
+                bytecode_cache_dir=TEMPLATE_CACHE_DIR
+            )
+            for template in default_templates.DEFAULT_TEMPLATES:
+                self._template_service.precompile(template)
         return self._template_service
 
 
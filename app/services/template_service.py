@@ -2,29 +2,147 @@
 
 from __future__ import annotations
 
+import re
+from collections import defaultdict
 from datetime import datetime
-from typing import Any, Dict, List
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
 
-from jinja2 import Environment, TemplateSyntaxError, UndefinedError
+from jinja2 import (
+    BytecodeCache,
+    Environment,
+    FileSystemBytecodeCache,
+    Template,
+    TemplateSyntaxError,
+    UndefinedError,
+)
 
 from app.exceptions import TemplateError
 from app.utils.description_utils import process_description
 
+# Upper bound on cached compiled templates (templates arrive in request bodies)
+MAX_COMPILED_TEMPLATES = 128
+
+# Bare top-level variable substitution, e.g. "{{ count }}"
+_SIMPLE_VARIABLE = re.compile(r"\{\{\s*([A-Za-z_][A-Za-z0-9_]*)\s*\}\}")
+
+# Names Jinja resolves to something other than a context variable
+_RESERVED_NAMES = frozenset(
+    {"true", "false", "none", "True", "False", "None", "self", "loop"}
+)
+
+
+class _SimpleTemplate:
+    """Renders literal text with top-level variables substituted, without Jinja.
+
+    The template is rewritten once into a str.format string, so rendering is a
+    single format_map call. Matches Jinja's output for such templates:
+    undefined names render as an empty string and a single trailing newline
+    is dropped.
+    """
+
+    __slots__ = ("_format",)
+
+    def __init__(self, literals: List[str], names: List[str]):
+        parts = [_escape_braces(literals[0])]
+        for name, literal in zip(names, literals[1:], strict=True):
+            parts.append(f"{{{name}!s}}")
+            parts.append(_escape_braces(literal))
+        self._format = "".join(parts)
+
+    def render(self, **context) -> str:
+        try:
+            return self._format.format_map(context)
+        except KeyError:
+            # Undefined names render empty, as with Jinja's default Undefined
+            return self._format.format_map(defaultdict(str, context))
+
+
+def _escape_braces(text: str) -> str:
+    """Escape literal braces for use in a str.format string"""
+    return text.replace("{", "{{").replace("}", "}}")
+
 
 class TemplateService:
-    """Handles Jinja2 template rendering for MS Graph data (events, messages, etc.)"""
+    """Handles Jinja2 template rendering for MS Graph data (events, messages, etc.)
+
+    Args:
+        bytecode_cache_dir: Optional directory for persisting the bytecode of
+            precompiled templates, so they survive process restarts without
+            re-parsing. Templates first seen in render() stay in memory only.
+    """
 
-    def __init__(self):
+    def __init__(self, bytecode_cache_dir: Optional[Path] = None):
         """Initialize Jinja2 environment with custom filters"""
-        self.env = Environment(
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
+        if bytecode_cache_dir is None:
+            # Instances without a bytecode cache share one environment
+            self.env = _DEFAULT_ENV
+        else:
+            bytecode_cache_dir.mkdir(parents=True, exist_ok=True)
+            self.env = _build_environment(
+                FileSystemBytecodeCache(str(bytecode_cache_dir))
+            )
+
+        # Compiled templates keyed by source, so repeated renders skip parsing
+        self._compiled: Dict[str, Union[Template, _SimpleTemplate]] = {}
+
+    def _compile(
+        self, template_string: str, persist: bool = False
+    ) -> Union[Template, _SimpleTemplate]:
+        """Return the compiled template for a source string, compiling it once"""
+        template = self._compiled.pop(template_string, None)
+        if template is None:
+            template = self._try_fast_path(template_string) or self._load(
+                template_string, persist
+            )
+            if len(self._compiled) >= MAX_COMPILED_TEMPLATES:
+                # Evict the least recently used entry (dicts keep insertion
+                # order, and hits are re-inserted at the end)
+                del self._compiled[next(iter(self._compiled))]
+        self._compiled[template_string] = template
+        return template
+
+    def _try_fast_path(self, template_string: str) -> Optional[_SimpleTemplate]:
+        """Build a _SimpleTemplate if the source only substitutes variables"""
+        if "\r" in template_string:
+            # Jinja normalizes newlines; leave that to the real engine
+            return None
+
+        pieces = _SIMPLE_VARIABLE.split(template_string)
+        literals, names = pieces[0::2], pieces[1::2]
+        if any("{{" in lit or "{%" in lit or "{#" in lit for lit in literals):
+            return None
+        if any(name in _RESERVED_NAMES or name in self.env.globals for name in names):
+            return None
 
-        # Register custom filters
-        self.env.filters["clean"] = self._clean_filter
-        self.env.filters["truncate"] = self._truncate_filter
-        self.env.filters["date_format"] = self._date_format_filter
+        # The checks above only look at what the fast path understands; let
+        # Jinja validate the whole source once, so malformed templates (e.g.
+        # "{{{ x }}}" or "{{ not }}") still raise TemplateSyntaxError
+        self.env.parse(template_string)
+
+        # Jinja drops a single trailing newline (keep_trailing_newline=False)
+        if literals[-1].endswith("\n"):
+            literals[-1] = literals[-1][:-1]
+        return _SimpleTemplate(literals, names)
+
+    def _load(self, template_string: str, persist: bool) -> Template:
+        """Compile a source string, going through the bytecode cache if asked to"""
+        bytecode_cache = self.env.bytecode_cache
+        if bytecode_cache is None or not persist:
+            # Request templates are unbounded, so they are never written to disk
+            return self.env.from_string(template_string)
+
+        # Jinja only consults the bytecode cache for loader templates, so
+        # string templates are bucketed by their source here
+        bucket = bytecode_cache.get_bucket(
+            self.env, template_string, None, template_string
+        )
+        if bucket.code is None:
+            bucket.code = self.env.compile(template_string)
+            bytecode_cache.set_bucket(bucket)
+        return self.env.template_class.from_code(
+            self.env, bucket.code, self.env.make_globals(None)
+        )
 
     def render_template(
         self,
@@ -58,6 +176,36 @@ class TemplateService:
             end_date=end_date,
         )
 
+    def precompile(self, template_string: str) -> None:
+        """
+        Compile a template ahead of its first render.
+
+        Use this to warm the cache with templates known at startup, such as
+        the MCP default templates. Only precompiled templates are written to
+        the bytecode cache.
+
+        Args:
+            template_string: Jinja2 template as string
+
+        Raises:
+            TemplateError: If template has syntax errors
+        """
+        try:
+            self._compile(template_string, persist=True)
+        except TemplateSyntaxError as e:
+            raise self._syntax_error(e, template_string) from e
+
+    @staticmethod
+    def _syntax_error(e: TemplateSyntaxError, template_string: str) -> TemplateError:
+        """Wrap a Jinja2 syntax error in a TemplateError"""
+        return TemplateError(
+            message=f"Template syntax error: {e.message}",
+            line_number=e.lineno,
+            details={
+                "template_snippet": template_string[:200] if template_string else None
+            },
+        )
+
     def render(self, template_string: str, **context) -> str:
         """
         Render a Jinja2 template with arbitrary context.
@@ -88,20 +236,12 @@ class TemplateService:
             )
         """
         try:
-            template = self.env.from_string(template_string)
+            template = self._compile(template_string)
             rendered = template.render(**context)
             return rendered
 
         except TemplateSyntaxError as e:
-            raise TemplateError(
-                message=f"Template syntax error: {e.message}",
-                line_number=e.lineno,
-                details={
-                    "template_snippet": template_string[:200]
-                    if template_string
-                    else None
-                },
-            )
+            raise self._syntax_error(e, template_string) from e
         except UndefinedError as e:
             raise TemplateError(
                 message=f"Undefined variable in template: {str(e)}",
@@ -139,7 +279,9 @@ class TemplateService:
             return ""
         if len(text) <= length:
             return text
-        return text[:length].rsplit(" ", 1)[0] + "..."
+        # Cut at the last space within the limit, or hard-cut if there is none
+        cut = text.rfind(" ", 0, length)
+        return text[: cut if cut != -1 else length] + "..."
 
     @staticmethod
     def _date_format_filter(
@@ -162,3 +304,24 @@ class TemplateService:
             return date_string
         except Exception:
             return date_string
+
+
+def _build_environment(
+    bytecode_cache: Optional[BytecodeCache] = None,
+) -> Environment:
+    """Create a Jinja2 environment with the custom filters registered"""
+    env = Environment(
+        trim_blocks=True,
+        lstrip_blocks=True,
+        bytecode_cache=bytecode_cache,
+    )
+
+    # Register custom filters
+    env.filters["clean"] = TemplateService._clean_filter
+    env.filters["truncate"] = TemplateService._truncate_filter
+    env.filters["date_format"] = TemplateService._date_format_filter
+    return env
+
+
+# Built once on import; filters are registered up front, so it is never mutated
+_DEFAULT_ENV = _build_environment()
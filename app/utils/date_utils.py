@@ -130,7 +130,7 @@ def parse_field_tags(field_tags_str: str | None) -> dict[str, str]:
 
     result = {}
     for pair in field_tags_str.split(","):
-        if ":" in pair:
-            field, tag = pair.split(":", 1)
+        field, sep, tag = pair.partition(":")
+        if sep:
             result[field.strip().lower()] = tag.strip()
     return result
@@ -5,6 +5,9 @@ from typing import Optional
 
 from bs4 import BeautifulSoup
 
+# Runs of spaces left behind after stripping HTML and newlines
+_MULTIPLE_SPACES = re.compile(r" +")
+
 
 def strip_html(html: str) -> str:
     """
@@ -61,7 +64,7 @@ def process_description(
         result = result.replace("#", "# ")
 
         # Collapse multiple spaces
-        result = re.sub(r" +", " ", result)
+        result = _MULTIPLE_SPACES.sub(" ", result)
 
     # Truncate if needed
     if max_length and len(result) > max_length:
@@ -1,6 +1,36 @@
 """Post-fetch filtering utilities for MS Graph data."""
 
-from typing import Any, Dict, List, Optional
+import re
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Compiled form of a filter: takes an item, returns whether it matches
+Predicate = Callable[[Dict[str, Any]], bool]
+
+# Predicate for one condition; filters with several conditions on the same
+# field pass a per-item cache of derived field values to share between them
+ConditionPredicate = Callable[[Dict[str, Any], Optional[Dict[str, Any]]], bool]
+
+# Parsed filter condition: (field path, operator, value)
+Condition = Tuple[str, str, str]
+
+# One comma-separated condition: field:value, or field:operator:value where
+# the value may itself contain colons (e.g. URLs). Parts without a colon
+# never match and are skipped.
+_CONDITION_PATTERN = re.compile(r"([^,:]*):(?:([^,:]*):)?([^,]*)")
+
+# Relative per-item cost of each operator; compiled filters test cheap
+# (and usually selective) equality checks before substring scans
+_OPERATOR_COST = {
+    "eq": 0,
+    "ne": 1,
+    "exists": 1,
+    "gt": 2,
+    "lt": 2,
+    "startswith": 3,
+    "endswith": 3,
+    "contains": 4,
+}
 
 
 def get_nested_value(obj: Dict[str, Any], path: str) -> Any:
@@ -11,13 +41,24 @@ def get_nested_value(obj: Dict[str, Any], path: str) -> Any:
         get_nested_value(msg, "subject") -> msg["subject"]
         get_nested_value(msg, "from.emailAddress.name") -> msg["from"]["emailAddress"]["name"]
     """
-    keys = path.split(".")
+    return _get_path(obj, _split_path(path))
+
+
+@lru_cache(maxsize=1024)
+def _split_path(path: str) -> Tuple[str, ...]:
+    """Split a dotted path into its keys (memoized, paths repeat per request)."""
+    return tuple(path.split("."))
+
+
+def _get_path(obj: Dict[str, Any], keys: Tuple[str, ...]) -> Any:
+    """Walk an already split dotted path (see get_nested_value)."""
     value = obj
     for key in keys:
-        if isinstance(value, dict):
-            value = value.get(key)
-        else:
+        # Graph payloads are plain dicts, so test the exact type first and
+        # only fall back to isinstance for dict subclasses / other values
+        if type(value) is not dict and not isinstance(value, dict):
             return None
+        value = value.get(key)
         if value is None:
             return None
     return value
@@ -37,98 +78,303 @@ def matches_filter(item: Dict[str, Any], field: str, operator: str, value: str)
         lt      - less than (for numbers/dates)
         exists  - field exists and is not None/empty
     """
-    actual = get_nested_value(item, field)
+    return _compile_condition(field, operator, value)(item)
+
+
+@lru_cache(maxsize=256)
+def _compile_condition(field: str, operator: str, value: str) -> ConditionPredicate:
+    """
+    Build the predicate for a single filter condition (memoized, so
+    matches_filter doesn't rebuild it for every item).
+
+    The path is split and the operator resolved once, so the returned
+    function only walks the item and compares. Conditions of one filter
+    may pass a shared per-item ``cache`` dict, so the lowercased text of a
+    field (or the member set of a list field) is computed once per item
+    rather than once per condition.
+    """
+    keys = _split_path(field)
 
     # Handle 'exists' operator
     if operator == "exists":
-        exists = actual is not None and actual != "" and actual != []
-        return exists if value.lower() in ("true", "1", "yes") else not exists
+        expected = value.lower() in ("true", "1", "yes")
 
-    # Handle None values
-    if actual is None:
-        return operator == "ne"
+        def exists(
+            item: Dict[str, Any], cache: Optional[Dict[str, Any]] = None
+        ) -> bool:
+            actual = _get_path(item, keys)
+            return (actual is not None and actual != "" and actual != []) is expected
 
-    # Handle list fields (e.g., categories)
-    if isinstance(actual, list):
-        if operator == "eq":
-            return value in actual
-        elif operator == "ne":
-            return value not in actual
-        elif operator == "contains":
-            return any(value.lower() in str(item).lower() for item in actual)
-        return False
+        return exists
+
+    text_test, list_test = _compile_test(operator, value)
+    # eq/ne on a list field are membership tests, which can use a set
+    membership = operator in ("eq", "ne")
+    members_key = field + ":members"
+    # None values only match 'ne'
+    on_none = operator == "ne"
+
+    def predicate(item: Dict[str, Any], cache: Optional[Dict[str, Any]] = None) -> bool:
+        actual = _get_path(item, keys)
+        if actual is None:
+            return on_none
+        # Handle list fields (e.g., categories)
+        if isinstance(actual, list):
+            if cache is None or not membership:
+                return list_test(actual)
+            members = cache.get(members_key)
+            if members is None:
+                try:
+                    members = cache[members_key] = frozenset(actual)
+                except TypeError:
+                    # Unhashable entries (e.g. dicts): scan the list
+                    return list_test(actual)
+            return list_test(members)
+        if cache is None:
+            return text_test(actual, str(actual).lower())
+        text = cache.get(field)
+        if text is None:
+            text = cache[field] = str(actual).lower()
+        return text_test(actual, text)
+
+    return predicate
+
+
+# Comparisons for one operator: (text_test, list_test), see _compile_test
+TextTest = Callable[[Any, str], bool]
+ListTest = Callable[[List[Any]], bool]
+Tests = Tuple[TextTest, ListTest]
 
-    # Convert to string for comparison
-    actual_str = str(actual).lower()
+
+def _compile_test(operator: str, value: str) -> Tests:
+    """
+    Build the comparisons for a non-None field value.
+
+    Returns a (text_test, list_test) pair. text_test receives the value and
+    its lowercased string form; list_test receives list values (or, for
+    eq/ne, possibly a frozenset of them), which support eq, ne and contains.
+    """
+    return _OPERATORS.get(operator, _unknown_tests)(value)
+
+
+def _eq_tests(value: str) -> Tests:
+    value_lower = value.lower()
+    return (
+        lambda actual, text: text == value_lower,
+        lambda actual: value in actual,
+    )
+
+
+def _ne_tests(value: str) -> Tests:
+    value_lower = value.lower()
+    return (
+        lambda actual, text: text != value_lower,
+        lambda actual: value not in actual,
+    )
+
+
+def _contains_tests(value: str) -> Tests:
+    # `in` on the lowercased text beats both str.find and a precompiled
+    # re.IGNORECASE search for subject/address/preview-sized fields, and the
+    # lowercased text is shared with other conditions on the same field
+    value_lower = value.lower()
+    return (
+        lambda actual, text: value_lower in text,
+        lambda actual: any(value_lower in str(entry).lower() for entry in actual),
+    )
+
+
+# The affix tests need the whole lowercased text: str.lower is context
+# sensitive (Greek final sigma), so lowercasing a slice can differ
+def _startswith_tests(value: str) -> Tests:
     value_lower = value.lower()
+    return lambda actual, text: text.startswith(value_lower), _no_list_match
+
+
+def _endswith_tests(value: str) -> Tests:
+    value_lower = value.lower()
+    return lambda actual, text: text.endswith(value_lower), _no_list_match
+
+
+def _gt_tests(value: str) -> Tests:
+    return _comparison_tests(value, greater=True)
 
-    if operator == "eq":
-        return actual_str == value_lower
-    elif operator == "ne":
-        return actual_str != value_lower
-    elif operator == "contains":
-        return value_lower in actual_str
-    elif operator == "startswith":
-        return actual_str.startswith(value_lower)
-    elif operator == "endswith":
-        return actual_str.endswith(value_lower)
-    elif operator in ("gt", "lt"):
-        try:
-            actual_num = float(actual)
-            value_num = float(value)
-            return (
-                actual_num > value_num if operator == "gt" else actual_num < value_num
-            )
-        except (ValueError, TypeError):
-            # Fall back to string comparison for dates
-            return (
-                actual_str > value_lower
-                if operator == "gt"
-                else actual_str < value_lower
-            )
 
+def _lt_tests(value: str) -> Tests:
+    return _comparison_tests(value, greater=False)
+
+
+def _comparison_tests(value: str, greater: bool) -> Tests:
+    value_lower = value.lower()
+    try:
+        value_num = float(value)
+    except ValueError:
+        # Non-numeric values (e.g. dates) always compare as strings
+        if greater:
+            return lambda actual, text: text > value_lower, _no_list_match
+        return lambda actual, text: text < value_lower, _no_list_match
+
+    def compare(actual: Any, text: str) -> bool:
+        if not isinstance(actual, (int, float)):
+            try:
+                actual = float(actual)
+            except (ValueError, TypeError):
+                # Fall back to string comparison for dates
+                return text > value_lower if greater else text < value_lower
+        return actual > value_num if greater else actual < value_num
+
+    return compare, _no_list_match
+
+
+def _unknown_tests(value: str) -> Tests:
+    return lambda actual, text: False, _no_list_match
+
+
+def _no_list_match(actual: List[Any]) -> bool:
+    """List test for operators that never match list fields."""
     return False
 
 
-def parse_filter_expression(filter_expr: str) -> List[tuple]:
+# Operator name -> builder of its comparisons ('exists' is handled by
+# _compile_condition, as it also has to look at missing values)
+_OPERATORS: Dict[str, Callable[[str], Tests]] = {
+    "eq": _eq_tests,
+    "ne": _ne_tests,
+    "contains": _contains_tests,
+    "startswith": _startswith_tests,
+    "endswith": _endswith_tests,
+    "gt": _gt_tests,
+    "lt": _lt_tests,
+}
+
+
+@lru_cache(maxsize=256)
+def parse_filter_expression(filter_expr: str) -> Tuple[Condition, ...]:
     """
     Parse a filter expression into conditions.
 
     Format: field:operator:value or field:value (defaults to 'eq')
     Multiple conditions separated by comma (AND logic)
 
+    Results are memoized, so they are returned as (immutable) tuples.
+
     Examples:
-        "categories:tana" -> [("categories", "eq", "tana")]
-        "categories:eq:tana" -> [("categories", "eq", "tana")]
-        "isRead:eq:false" -> [("isRead", "eq", "false")]
-        "from.emailAddress.address:contains:@sap.com" -> [("from.emailAddress.address", "contains", "@sap.com")]
-        "categories:tana,isRead:eq:false" -> [("categories", "eq", "tana"), ("isRead", "eq", "false")]
+        "categories:tana" -> (("categories", "eq", "tana"),)
+        "categories:eq:tana" -> (("categories", "eq", "tana"),)
+        "isRead:eq:false" -> (("isRead", "eq", "false"),)
+        "from.emailAddress.address:contains:@sap.com" -> (("from.emailAddress.address", "contains", "@sap.com"),)
+        "categories:tana,isRead:eq:false" -> (("categories", "eq", "tana"), ("isRead", "eq", "false"))
     """
     conditions = []
+    for match in _CONDITION_PATTERN.finditer(filter_expr):
+        field, operator, value = match.groups()
+        # field:value format defaults to 'eq'
+        operator = "eq" if operator is None else operator.strip().lower()
+        conditions.append((field.strip(), operator, value.strip()))
+    return tuple(conditions)
+
+
+@lru_cache(maxsize=128)
+def compile_filter(filter_expr: str, match_all: bool = True) -> Optional[Predicate]:
+    """
+    Compile a filter expression into a single predicate.
+
+    Each condition is turned into a closure with its path pre-split and its
+    operator resolved, so applying the filter does no parsing or operator
+    dispatch per item. Compiled filters are cached by expression, so
+    repeated requests with the same filter reuse them.
+
+    Conditions are evaluated cheapest first (see _OPERATOR_COST) and stop
+    at the first one that decides the result.
+
+    Returns:
+        Predicate taking an item, or None if the expression has no conditions
+    """
+    conditions = sorted(
+        parse_filter_expression(filter_expr),
+        key=lambda condition: _OPERATOR_COST.get(condition[1], 5),
+    )
+    if len(conditions) == 1:
+        field, op, val = conditions[0]
+        # Most filters are a single top-level equality (e.g. "categories:Work")
+        if op == "eq" and "." not in field:
+            return _compile_top_level_eq(field, val)
 
-    # Split by comma, but handle values that might contain commas
-    parts = filter_expr.split(",")
+    predicates = tuple(
+        _compile_condition(field, op, val) for field, op, val in conditions
+    )
+    if not predicates:
+        return None
+    if len(predicates) == 1:
+        return predicates[0]
 
-    for part in parts:
-        part = part.strip()
-        if not part:
-            continue
+    # Share derived values only when several conditions read one field
+    fields = [field for field, op, _ in conditions if op != "exists"]
+    if len(set(fields)) < len(fields):
+        return _combine_sharing_cache(predicates, match_all)
 
-        # Split by colon
-        segments = part.split(":")
+    if match_all:
 
-        if len(segments) == 2:
-            # field:value format (default to 'eq')
-            field, value = segments
-            conditions.append((field.strip(), "eq", value.strip()))
-        elif len(segments) >= 3:
-            # field:operator:value format (value might contain colons)
-            field = segments[0].strip()
-            operator = segments[1].strip().lower()
-            value = ":".join(segments[2:]).strip()  # Rejoin in case value had colons
-            conditions.append((field, operator, value))
+        def match_every(item: Dict[str, Any]) -> bool:
+            for predicate in predicates:
+                if not predicate(item):
+                    return False
+            return True
 
-    return conditions
+        return match_every
+
+    def match_any(item: Dict[str, Any]) -> bool:
+        for predicate in predicates:
+            if predicate(item):
+                return True
+        return False
+
+    return match_any
+
+
+def _compile_top_level_eq(field: str, value: str) -> Predicate:
+    """
+    Build an eq predicate for a top-level field, with the path walk and the
+    operator tests inlined (same semantics as _compile_condition).
+    """
+    value_lower = value.lower()
+
+    def top_level_eq(item: Dict[str, Any]) -> bool:
+        actual = item.get(field)
+        if actual is None:
+            return False
+        if type(actual) is str:
+            return actual.lower() == value_lower
+        if isinstance(actual, list):
+            return value in actual
+        return str(actual).lower() == value_lower
+
+    return top_level_eq
+
+
+def _combine_sharing_cache(
+    predicates: Tuple[ConditionPredicate, ...], match_all: bool
+) -> Predicate:
+    """Combine predicates, passing each item's derived-value cache along."""
+    if match_all:
+
+        def match_every(item: Dict[str, Any]) -> bool:
+            cache: Dict[str, Any] = {}
+            for predicate in predicates:
+                if not predicate(item, cache):
+                    return False
+            return True
+
+        return match_every
+
+    def match_any(item: Dict[str, Any]) -> bool:
+        cache: Dict[str, Any] = {}
+        for predicate in predicates:
+            if predicate(item, cache):
+                return True
+        return False
+
+    return match_any
 
 
 def apply_filter(
@@ -143,7 +389,9 @@ def apply_filter(
         match_all: If True, all conditions must match (AND). If False, any condition (OR).
 
     Returns:
-        Filtered list of items
+        Filtered list of items. Without conditions (empty/None filter) or
+        items, the input list itself is returned rather than a copy; all
+        callers just rebind the result.
 
     Examples:
         apply_filter(messages, "categories:tana")
@@ -151,22 +399,12 @@ def apply_filter(
         apply_filter(messages, "from.emailAddress.address:contains:@sap.com")
         apply_filter(messages, "categories:tana,isRead:eq:false")  # AND
     """
+    # Checked before any parsing/compiling: most requests carry no filter
     if not filter_expr or not items:
         return items
 
-    conditions = parse_filter_expression(filter_expr)
-    if not conditions:
+    predicate = compile_filter(filter_expr, match_all)
+    if predicate is None:
         return items
 
-    result = []
-    for item in items:
-        matches = [
-            matches_filter(item, field, op, val) for field, op, val in conditions
-        ]
-
-        if match_all and all(matches):
-            result.append(item)
-        elif not match_all and any(matches):
-            result.append(item)
-
-    return result
+    return [item for item in items if predicate(item)]
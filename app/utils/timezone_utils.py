@@ -1,7 +1,41 @@
 """Timezone detection and conversion utilities."""
 
+import time
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from functools import lru_cache
+from typing import Dict, Optional
+
+# Common UTC offsets (in hours) mapped to Windows timezone names
+# Reference: https://learn.microsoft.com/en-us/windows-hardware/manufacture/desktop/default-time-zones
+_WINDOWS_TIMEZONE_NAMES: Dict[float, str] = {
+    -12: "Dateline Standard Time",
+    -11: "UTC-11",
+    -10: "Hawaiian Standard Time",
+    -9: "Alaskan Standard Time",
+    -8: "Pacific Standard Time",
+    -7: "Mountain Standard Time",
+    -6: "Central Standard Time",
+    -5: "Eastern Standard Time",
+    -4: "Atlantic Standard Time",
+    -3: "SA Eastern Standard Time",
+    -2: "UTC-02",
+    -1: "Azores Standard Time",
+    0: "UTC",
+    1: "W. Europe Standard Time",
+    2: "Central European Standard Time",  # UTC+2 (CEST)
+    3: "Russian Standard Time",
+    4: "Arabian Standard Time",
+    5: "West Asia Standard Time",
+    5.5: "India Standard Time",
+    6: "Central Asia Standard Time",
+    7: "SE Asia Standard Time",
+    8: "China Standard Time",
+    9: "Tokyo Standard Time",
+    9.5: "AUS Central Standard Time",
+    10: "AUS Eastern Standard Time",
+    11: "Central Pacific Standard Time",
+    12: "New Zealand Standard Time",
+}
 
 
 def get_system_timezone_name() -> str:
@@ -11,59 +45,42 @@ def get_system_timezone_name() -> str:
     Auto-detects timezone based on system UTC offset.
     Returns Windows timezone name (e.g., "Central European Standard Time")
     Falls back to "UTC" if detection fails
+
+    A detected name is cached for the current half hour (see _cache_slot);
+    the fallback is not cached, so detection is retried on the next call.
     """
     try:
-        # Get local timezone offset
-        local_now = datetime.now()
-        utc_now = datetime.now(timezone.utc).replace(tzinfo=None)
-        offset = local_now - utc_now
-        offset_hours = offset.total_seconds() / 3600
-
-        # Round to nearest 0.5 hours to handle floating point precision
-        # and support half-hour timezones like India (UTC+5:30)
-        offset_hours = round(offset_hours * 2) / 2
-
-        # Map common offsets to Windows timezone names
-        # Reference: https://learn.microsoft.com/en-us/windows-hardware/manufacture/desktop/default-time-zones
-        timezone_map = {
-            -12: "Dateline Standard Time",
-            -11: "UTC-11",
-            -10: "Hawaiian Standard Time",
-            -9: "Alaskan Standard Time",
-            -8: "Pacific Standard Time",
-            -7: "Mountain Standard Time",
-            -6: "Central Standard Time",
-            -5: "Eastern Standard Time",
-            -4: "Atlantic Standard Time",
-            -3: "SA Eastern Standard Time",
-            -2: "UTC-02",
-            -1: "Azores Standard Time",
-            0: "UTC",
-            1: "W. Europe Standard Time",
-            2: "Central European Standard Time",  # UTC+2 (CEST)
-            3: "Russian Standard Time",
-            4: "Arabian Standard Time",
-            5: "West Asia Standard Time",
-            5.5: "India Standard Time",
-            6: "Central Asia Standard Time",
-            7: "SE Asia Standard Time",
-            8: "China Standard Time",
-            9: "Tokyo Standard Time",
-            9.5: "AUS Central Standard Time",
-            10: "AUS Eastern Standard Time",
-            11: "Central Pacific Standard Time",
-            12: "New Zealand Standard Time",
-        }
-
-        return timezone_map.get(offset_hours, "UTC")
+        return _detect_system_timezone_name(_cache_slot())
     except Exception:
         # If anything goes wrong, default to UTC
         return "UTC"
 
 
+@lru_cache(maxsize=1)
+def _detect_system_timezone_name(slot: int) -> str:
+    """Detect the timezone name (``slot`` only keys the cache)."""
+    offset_hours = _local_utc_offset().total_seconds() / 3600
+
+    # Round to nearest 0.5 hours to handle floating point precision
+    # and support half-hour timezones like India (UTC+5:30)
+    offset_hours = round(offset_hours * 2) / 2
+
+    return _WINDOWS_TIMEZONE_NAMES.get(offset_hours, "UTC")
+
+
+def clear_timezone_cache() -> None:
+    """Forget cached timezone detection (e.g. after mocking the clock)."""
+    _detect_system_timezone_name.cache_clear()
+    _detect_local_timezone.cache_clear()
+
+
 def format_datetime_for_graph(dt: datetime) -> str:
     """Format datetime for Graph API query parameters"""
-    return dt.strftime("%Y-%m-%dT%H:%M:%S")
+    # isoformat is a dedicated C path (strftime goes through the C locale);
+    # strip tzinfo so the output stays "YYYY-MM-DDTHH:MM:SS" as before
+    if dt.tzinfo is not None:
+        dt = dt.replace(tzinfo=None)
+    return dt.isoformat(timespec="seconds")
 
 
 def convert_to_local_timezone(dt: datetime) -> datetime:
@@ -80,16 +97,8 @@ def convert_to_local_timezone(dt: datetime) -> datetime:
     if dt.tzinfo is None:
         dt = dt.replace(tzinfo=timezone.utc)
 
-    # Get local timezone offset (rounded to nearest minute to avoid float precision issues)
-    local_now = datetime.now()
-    utc_now = datetime.now(timezone.utc).replace(tzinfo=None)
-    offset_seconds = round((local_now - utc_now).total_seconds() / 60) * 60
-
-    # Create a timezone with that offset
-    local_tz = timezone(timedelta(seconds=offset_seconds))
-
     # Convert to local timezone
-    return dt.astimezone(local_tz)
+    return dt.astimezone(get_local_timezone())
 
 
 def format_datetime_local(dt: datetime) -> Optional[str]:
@@ -109,18 +118,38 @@ def get_local_timezone() -> timezone:
     """
     Get the local system timezone as a timezone object.
 
-    Calculates the UTC offset based on the difference between local time
-    and UTC time, rounded to the nearest minute.
+    Uses the current UTC offset of local time, rounded to the nearest minute.
+    Cached for the current half hour, like get_system_timezone_name.
 
     Returns:
         timezone: Local timezone with correct UTC offset.
     """
-    local_now = datetime.now()
-    utc_now = datetime.now(timezone.utc).replace(tzinfo=None)
-    offset_seconds = round((local_now - utc_now).total_seconds() / 60) * 60
+    return _detect_local_timezone(_cache_slot())
+
+
+@lru_cache(maxsize=1)
+def _detect_local_timezone(slot: int) -> timezone:
+    """Build the local timezone (``slot`` only keys the cache)."""
+    offset_seconds = round(_local_utc_offset().total_seconds() / 60) * 60
     return timezone(timedelta(seconds=offset_seconds))
 
 
+def _cache_slot() -> int:
+    """
+    Half hours since the epoch, used to expire the cached timezone.
+
+    DST transitions fall on a full or half hour in UTC (e.g. Adelaide and
+    Lord Howe switch at :30), so a new offset is picked up by the first call
+    after the change.
+    """
+    return int(time.time() // 1800)
+
+
+def _local_utc_offset() -> timedelta:
+    """Current UTC offset of the system's local time (one clock read)."""
+    return datetime.now().astimezone().utcoffset()
+
+
 def format_graph_datetime(datetime_str: str) -> Optional[str]:
     """
     Convert MS Graph datetime string to ISO format with local timezone offset.
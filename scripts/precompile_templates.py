@@ -0,0 +1,22 @@
+"""Precompile the MCP default templates into the on-disk bytecode cache.
+
+Run once at build/deploy time so the first MCP tool call of a fresh process
+loads compiled bytecode instead of parsing templates:
+
+    uv run python scripts/precompile_templates.py
+"""
+
+from app.config import TEMPLATE_CACHE_DIR
+from app.mcp.default_templates import DEFAULT_TEMPLATES
+from app.services.template_service import TemplateService
+
+
+def main() -> None:
+    service = TemplateService(bytecode_cache_dir=TEMPLATE_CACHE_DIR)
+    for template in DEFAULT_TEMPLATES:
+        service.precompile(template)
+    print(f"Precompiled {len(DEFAULT_TEMPLATES)} templates into {TEMPLATE_CACHE_DIR}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,36 +5,26 @@ import pytest
 from datetime import datetime
 from fastapi.testclient import TestClient
 
-# Set environment variables before importing the app
+# Set environment variables before the app is imported
 os.environ["CLIENT_ID"] = "test-client-id"
 os.environ["TENANT_ID"] = "test-tenant-id"
 
-from app.main import app
-
 
 @pytest.fixture
 def client():
     """FastAPI test client"""
+    # Imported lazily so collecting unit tests doesn't load the whole app
+    from app.main import app
+
     return TestClient(app)
 
 
 @pytest.fixture
-def fixed_datetime(monkeypatch):
-    """Fixture to freeze datetime.now() for testing"""
-    fixed_date = datetime(2025, 10, 5, 12, 0, 0)  # Saturday, Oct 5, 2025
-
-    class MockDatetime:
-        @classmethod
-        def now(cls):
-            return fixed_date
-
-        @classmethod
-        def fromisoformat(cls, date_string):
-            return datetime.fromisoformat(date_string)
-
-        @classmethod
-        def strptime(cls, date_string, format):
-            return datetime.strptime(date_string, format)
-
-    monkeypatch.setattr("app.utils.date_utils.datetime", MockDatetime)
-    return fixed_date
+def fixed_datetime():
+    """Freeze the clock at a fixed date for the requesting test only"""
+    import time_machine
+
+    fixed_date = datetime(2025, 10, 5, 12, 0, 0)  # Sunday, Oct 5, 2025
+    # time_machine treats naive datetimes as UTC; anchor to local time instead
+    with time_machine.travel(fixed_date.astimezone(), tick=False):
+        yield fixed_date
@@ -0,0 +1,11 @@
+"""Shared fixtures for service unit tests"""
+
+import pytest
+
+from app.services.template_service import TemplateService
+
+
+@pytest.fixture(scope="session")
+def template_service():
+    """One TemplateService for the session (rendering is stateless per call)"""
+    return TemplateService()
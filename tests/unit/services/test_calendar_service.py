@@ -1,9 +1,58 @@
 """Unit tests for CalendarService"""
 
-from unittest.mock import MagicMock
+import functools
+import re
+from unittest.mock import MagicMock, Mock
+
+import pytest
+from msgraph.generated.models.attendee_type import AttendeeType
+from msgraph.generated.models.event import Event
 
 from app.services.calendar_service import CalendarService
 
+# Attendee block as emitted by format_as_tana, matched in a single scan
+ATTENDEES_PATTERN = re.compile(
+    r"^  - Attendees::\n    - John Doe\n    - jane@example\.com$", re.MULTILINE
+)
+
+
+# Field values of a minimal Kiota Event; tests override what they exercise
+MINIMAL_EVENT_FIELDS = {
+    "id": "test-123",
+    "subject": "Test",
+    "body_preview": "",
+    "body": None,
+    "start": None,
+    "end": None,
+    "location": None,
+    "locations": None,
+    "attendees": None,
+    "organizer": None,
+    "response_status": None,
+    "categories": None,
+    "importance": None,
+    "sensitivity": None,
+    "show_as": None,
+    "type": None,
+    "is_all_day": False,
+    "is_cancelled": False,
+    "is_online_meeting": False,
+    "has_attachments": False,
+    "is_reminder_on": False,
+    "reminder_minutes_before_start": 0,
+    "online_meeting": None,
+    "online_meeting_url": None,
+    "web_link": None,
+    "recurrence": None,
+}
+
+
+def _make_event(**fields) -> Mock:
+    """Create a spec'd mock event from MINIMAL_EVENT_FIELDS plus overrides."""
+    event = Mock(spec=Event)
+    event.configure_mock(**{**MINIMAL_EVENT_FIELDS, **fields})
+    return event
+
 
 def _create_calendar_service() -> CalendarService:
     """Create a CalendarService with a mock GraphService."""
@@ -11,245 +60,182 @@ def _create_calendar_service() -> CalendarService:
     return CalendarService(graph_service=mock_graph_service)
 
 
+@pytest.fixture(autouse=True, scope="class")
+def _service(request):
+    """Share one CalendarService per test class (the service is stateless)."""
+    request.cls.service = _create_calendar_service()
+
+
+def _make_maximal_event() -> Mock:
+    """Create a mock event with every converted field populated."""
+    body = MagicMock()
+    body.content_type = "html"
+    body.content = "<p>Meeting notes</p>"
+
+    start = MagicMock()
+    start.date_time = "2025-10-05T10:00:00"
+    start.time_zone = "Europe/Berlin"
+    end = MagicMock()
+    end.date_time = "2025-10-05T11:00:00"
+    end.time_zone = "Europe/Berlin"
+
+    location = MagicMock()
+    location.display_name = "Conference Room A"
+    location.location_type = "conferenceRoom"
+    loc1 = MagicMock()
+    loc1.display_name = "Room A"
+    loc2 = MagicMock()
+    loc2.display_name = "Room B"
+
+    att = MagicMock()
+    att.type = "required"
+    att.status = MagicMock()
+    att.status.response = "accepted"
+    att.status.time = MagicMock()
+    att.status.time.isoformat.return_value = "2025-10-01T10:00:00"
+    att.email_address = MagicMock()
+    att.email_address.name = "John Doe"
+    att.email_address.address = "john@example.com"
+
+    organizer = MagicMock()
+    organizer.email_address = MagicMock()
+    organizer.email_address.name = "Organizer"
+    organizer.email_address.address = "org@example.com"
+
+    response_status = MagicMock()
+    response_status.response = "accepted"
+    response_status.time = MagicMock()
+    response_status.time.isoformat.return_value = "2025-10-01T09:00:00"
+
+    online_meeting = MagicMock()
+    online_meeting.join_url = "https://teams.microsoft.com/meeting/123"
+
+    recurrence = MagicMock()
+    recurrence.pattern = MagicMock()
+    recurrence.pattern.type = "weekly"
+    recurrence.pattern.interval = 1
+
+    return _make_event(
+        subject="Test Meeting",
+        body_preview="Preview text",
+        body=body,
+        start=start,
+        end=end,
+        location=location,
+        locations=[loc1, loc2],
+        attendees=[att],
+        organizer=organizer,
+        response_status=response_status,
+        categories=["Work", "Important"],
+        importance="high",
+        sensitivity="private",
+        show_as="busy",
+        type="singleInstance",
+        is_online_meeting=True,
+        is_reminder_on=True,
+        reminder_minutes_before_start=15,
+        online_meeting=online_meeting,
+        online_meeting_url="https://teams.microsoft.com/meeting/123",
+        web_link="https://outlook.com/event/123",
+        recurrence=recurrence,
+    )
+
+
+def _get_path(data, path):
+    """Walk a tuple of keys/indexes into a nested dict/list."""
+    return functools.reduce(lambda value, key: value[key], path, data)
+
+
 class TestEventToDict:
     """Tests for CalendarService._event_to_dict method"""
 
-    def setup_method(self):
-        self.service = _create_calendar_service()
-
-    def test_basic_fields(self):
-        """Test basic event fields are converted"""
-        event = MagicMock()
-        event.id = "test-123"
-        event.subject = "Test Meeting"
-        event.body_preview = "Preview text"
-        event.body = None
-        event.start = None
-        event.end = None
-        event.location = None
-        event.locations = None
-        event.attendees = None
-        event.organizer = None
-        event.response_status = None
-        event.categories = None
-        event.importance = None
-        event.sensitivity = None
-        event.show_as = None
-        event.type = None
-        event.is_all_day = False
-        event.is_cancelled = False
-        event.is_online_meeting = False
-        event.has_attachments = False
-        event.is_reminder_on = True
-        event.reminder_minutes_before_start = 15
-        event.online_meeting = None
-        event.online_meeting_url = None
-        event.web_link = "https://outlook.com/event/123"
-        event.recurrence = None
-
-        result = self.service._event_to_dict(event)
-
-        assert result["id"] == "test-123"
-        assert result["subject"] == "Test Meeting"
-        assert result["bodyPreview"] == "Preview text"
-        assert result["isAllDay"] is False
-        assert result["isCancelled"] is False
-        assert result["webLink"] == "https://outlook.com/event/123"
-
-    def test_body_conversion(self):
-        """Test body field conversion"""
-        event = self._make_minimal_event()
-        event.body = MagicMock()
-        event.body.content_type = "html"
-        event.body.content = "<p>Meeting notes</p>"
-
-        result = self.service._event_to_dict(event)
-
-        assert result["body"]["contentType"] == "html"
-        assert result["body"]["content"] == "<p>Meeting notes</p>"
-
-    def test_start_end_times(self):
+    @pytest.fixture(scope="class")
+    def result(self, request):
+        """Convert the maximal event once and share it across the table"""
+        return request.cls.service._event_to_dict(_make_maximal_event())
+
+    @pytest.mark.parametrize(
+        "path,expected",
+        [
+            # Basic fields
+            (("id",), "test-123"),
+            (("subject",), "Test Meeting"),
+            (("bodyPreview",), "Preview text"),
+            (("isAllDay",), False),
+            (("isCancelled",), False),
+            (("webLink",), "https://outlook.com/event/123"),
+            # Body
+            (("body", "contentType"), "html"),
+            (("body", "content"), "<p>Meeting notes</p>"),
+            # Start/End
+            (("start", "timeZone"), "Europe/Berlin"),
+            (("end", "timeZone"), "Europe/Berlin"),
+            # Location(s)
+            (("location", "displayName"), "Conference Room A"),
+            (("location", "locationType"), "conferenceRoom"),
+            (("locations",), [{"displayName": "Room A"}, {"displayName": "Room B"}]),
+            # Attendees
+            (
+                ("attendees",),
+                [
+                    {
+                        "type": "required",
+                        "status": {
+                            "response": "accepted",
+                            "time": "2025-10-01T10:00:00",
+                        },
+                        "emailAddress": {
+                            "name": "John Doe",
+                            "address": "john@example.com",
+                        },
+                    }
+                ],
+            ),
+            # Organizer
+            (("organizer", "emailAddress", "name"), "Organizer"),
+            (("organizer", "emailAddress", "address"), "org@example.com"),
+            # Response status
+            (("responseStatus", "response"), "accepted"),
+            (("responseStatus", "time"), "2025-10-01T09:00:00"),
+            # Categories
+            (("categories",), ["Work", "Important"]),
+            # Enum fields
+            (("importance",), "high"),
+            (("sensitivity",), "private"),
+            (("showAs",), "busy"),
+            (("type",), "singleInstance"),
+            # Online meeting
+            (("isOnlineMeeting",), True),
+            (("onlineMeeting", "joinUrl"), "https://teams.microsoft.com/meeting/123"),
+            (("onlineMeetingUrl",), "https://teams.microsoft.com/meeting/123"),
+            # Recurrence
+            (("recurrence", "pattern", "type"), "weekly"),
+            (("recurrence", "pattern", "interval"), 1),
+        ],
+    )
+    def test_field_conversion(self, result, path, expected):
+        """Test each converted field against its MS Graph JSON path"""
+        assert _get_path(result, path) == expected
+
+    def test_start_end_times(self, result):
         """Test start/end time conversion"""
-        event = self._make_minimal_event()
-        event.start = MagicMock()
-        event.start.date_time = "2025-10-05T10:00:00"
-        event.start.time_zone = "Europe/Berlin"
-        event.end = MagicMock()
-        event.end.date_time = "2025-10-05T11:00:00"
-        event.end.time_zone = "Europe/Berlin"
-
-        result = self.service._event_to_dict(event)
-
         # DateTime now includes timezone offset (ISO format)
         assert result["start"]["dateTime"].startswith("2025-10-05T10:00:00")
-        assert result["start"]["timeZone"] == "Europe/Berlin"
         assert result["end"]["dateTime"].startswith("2025-10-05T11:00:00")
 
-    def test_location_conversion(self):
-        """Test location field conversion"""
-        event = self._make_minimal_event()
-        event.location = MagicMock()
-        event.location.display_name = "Conference Room A"
-        event.location.location_type = "conferenceRoom"
-
-        result = self.service._event_to_dict(event)
-
-        assert result["location"]["displayName"] == "Conference Room A"
-        assert result["location"]["locationType"] == "conferenceRoom"
-
-    def test_multiple_locations(self):
-        """Test multiple locations conversion"""
-        event = self._make_minimal_event()
-        loc1 = MagicMock()
-        loc1.display_name = "Room A"
-        loc2 = MagicMock()
-        loc2.display_name = "Room B"
-        event.locations = [loc1, loc2]
-
-        result = self.service._event_to_dict(event)
-
-        assert len(result["locations"]) == 2
-        assert result["locations"][0]["displayName"] == "Room A"
-        assert result["locations"][1]["displayName"] == "Room B"
-
-    def test_attendees_conversion(self):
-        """Test attendees field conversion"""
-        event = self._make_minimal_event()
-        att = MagicMock()
-        att.type = "required"
-        att.status = MagicMock()
-        att.status.response = "accepted"
-        att.status.time = MagicMock()
-        att.status.time.isoformat.return_value = "2025-10-01T10:00:00"
-        att.email_address = MagicMock()
-        att.email_address.name = "John Doe"
-        att.email_address.address = "john@example.com"
-        event.attendees = [att]
-
-        result = self.service._event_to_dict(event)
-
-        assert len(result["attendees"]) == 1
-        assert result["attendees"][0]["type"] == "required"
-        assert result["attendees"][0]["emailAddress"]["name"] == "John Doe"
-
-    def test_organizer_conversion(self):
-        """Test organizer field conversion"""
-        event = self._make_minimal_event()
-        event.organizer = MagicMock()
-        event.organizer.email_address = MagicMock()
-        event.organizer.email_address.name = "Organizer"
-        event.organizer.email_address.address = "org@example.com"
-
-        result = self.service._event_to_dict(event)
-
-        assert result["organizer"]["emailAddress"]["name"] == "Organizer"
-        assert result["organizer"]["emailAddress"]["address"] == "org@example.com"
-
-    def test_response_status_conversion(self):
-        """Test response status conversion"""
-        event = self._make_minimal_event()
-        event.response_status = MagicMock()
-        event.response_status.response = "accepted"
-        event.response_status.time = MagicMock()
-        event.response_status.time.isoformat.return_value = "2025-10-01T09:00:00"
-
-        result = self.service._event_to_dict(event)
-
-        assert result["responseStatus"]["response"] == "accepted"
-        assert result["responseStatus"]["time"] == "2025-10-01T09:00:00"
-
-    def test_categories_conversion(self):
-        """Test categories field conversion"""
-        event = self._make_minimal_event()
-        event.categories = ["Work", "Important"]
-
-        result = self.service._event_to_dict(event)
-
-        assert result["categories"] == ["Work", "Important"]
-
-    def test_enum_fields(self):
-        """Test enum field conversions"""
-        event = self._make_minimal_event()
-        event.importance = "high"
-        event.sensitivity = "private"
-        event.show_as = "busy"
-        event.type = "singleInstance"
-
-        result = self.service._event_to_dict(event)
-
-        assert result["importance"] == "high"
-        assert result["sensitivity"] == "private"
-        assert result["showAs"] == "busy"
-        assert result["type"] == "singleInstance"
-
-    def test_online_meeting_conversion(self):
-        """Test online meeting fields"""
-        event = self._make_minimal_event()
-        event.is_online_meeting = True
-        event.online_meeting = MagicMock()
-        event.online_meeting.join_url = "https://teams.microsoft.com/meeting/123"
-        event.online_meeting_url = "https://teams.microsoft.com/meeting/123"
-
-        result = self.service._event_to_dict(event)
-
-        assert result["isOnlineMeeting"] is True
-        assert (
-            result["onlineMeeting"]["joinUrl"]
-            == "https://teams.microsoft.com/meeting/123"
-        )
-        assert result["onlineMeetingUrl"] == "https://teams.microsoft.com/meeting/123"
-
-    def test_recurrence_conversion(self):
-        """Test recurrence field conversion"""
-        event = self._make_minimal_event()
-        event.recurrence = MagicMock()
-        event.recurrence.pattern = MagicMock()
-        event.recurrence.pattern.type = "weekly"
-        event.recurrence.pattern.interval = 1
-
-        result = self.service._event_to_dict(event)
-
-        assert result["recurrence"]["pattern"]["type"] == "weekly"
-        assert result["recurrence"]["pattern"]["interval"] == 1
-
-    def _make_minimal_event(self):
-        """Create a minimal mock event with all required fields"""
-        event = MagicMock()
-        event.id = "test-123"
-        event.subject = "Test"
-        event.body_preview = ""
-        event.body = None
-        event.start = None
-        event.end = None
-        event.location = None
-        event.locations = None
-        event.attendees = None
-        event.organizer = None
-        event.response_status = None
-        event.categories = None
-        event.importance = None
-        event.sensitivity = None
-        event.show_as = None
-        event.type = None
-        event.is_all_day = False
-        event.is_cancelled = False
-        event.is_online_meeting = False
-        event.has_attachments = False
-        event.is_reminder_on = False
-        event.reminder_minutes_before_start = 0
-        event.online_meeting = None
-        event.online_meeting_url = None
-        event.web_link = None
-        event.recurrence = None
-        return event
+    def test_minimal_event_omits_optional_blocks(self):
+        """Test unset nested fields are left out or defaulted"""
+        result = self.service._event_to_dict(_make_event())
+
+        for key in ("body", "start", "end", "location", "attendees", "recurrence"):
+            assert key not in result
+        assert result["categories"] == []
+        assert result["importance"] is None
 
 
 class TestFormatAsTana:
     """Tests for CalendarService.format_as_tana method"""
 
-    def setup_method(self):
-        self.service = _create_calendar_service()
-
     def test_empty_events(self):
         """Test formatting empty event list"""
         result = self.service.format_as_tana([])
@@ -300,9 +286,7 @@ class TestFormatAsTana:
 
         result = self.service.format_as_tana(events)
 
-        assert "Attendees::" in result
-        assert "John Doe" in result
-        assert "jane@example.com" in result
+        assert ATTENDEES_PATTERN.search(result)
 
     def test_event_with_categories(self):
         """Test formatting event with categories"""
@@ -352,9 +336,6 @@ class TestFormatAsTana:
 class TestBuildAttendees:
     """Tests for CalendarService._build_attendees method"""
 
-    def setup_method(self):
-        self.service = _create_calendar_service()
-
     def test_single_attendee_full_format(self):
         """Test building single attendee with full format"""
         attendees = [
@@ -369,7 +350,7 @@ class TestBuildAttendees:
         assert len(result) == 1
         assert result[0].email_address.address == "john@example.com"
         assert result[0].email_address.name == "John Doe"
-        assert str(result[0].type) == "AttendeeType.Required"
+        assert result[0].type is AttendeeType.Required
 
     def test_attendee_string_email(self):
         """Test building attendee with string email address"""
@@ -388,7 +369,7 @@ class TestBuildAttendees:
 
         result = self.service._build_attendees(attendees)
 
-        assert str(result[0].type) == "AttendeeType.Optional"
+        assert result[0].type is AttendeeType.Optional
 
     def test_attendee_resource_type(self):
         """Test building attendee with resource type"""
@@ -398,7 +379,7 @@ class TestBuildAttendees:
 
         result = self.service._build_attendees(attendees)
 
-        assert str(result[0].type) == "AttendeeType.Resource"
+        assert result[0].type is AttendeeType.Resource
 
     def test_attendee_default_type(self):
         """Test attendee defaults to required type"""
@@ -406,7 +387,7 @@ class TestBuildAttendees:
 
         result = self.service._build_attendees(attendees)
 
-        assert str(result[0].type) == "AttendeeType.Required"
+        assert result[0].type is AttendeeType.Required
 
     def test_multiple_attendees(self):
         """Test building multiple attendees"""
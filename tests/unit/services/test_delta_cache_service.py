@@ -1,49 +1,77 @@
 """Unit tests for DeltaCacheService"""
 
 import json
-import tempfile
 from pathlib import Path
 
 import pytest
 
 from app.services.delta_cache_service import DeltaCacheService
 
+INBOX_DELTA_LINK = "https://graph.microsoft.com/v1.0/me/mailFolders/inbox/messages/delta?$deltatoken=abc123"
+
 
 class TestDeltaCacheService:
     """Tests for DeltaCacheService"""
 
     @pytest.fixture
-    def temp_cache_dir(self):
-        """Create a temporary directory for cache files"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            yield Path(tmpdir)
+    def cache_dir(self, fs):
+        """Cache directory on pyfakefs's in-memory filesystem"""
+        return Path("/cache")
 
     @pytest.fixture
-    def cache_service(self, temp_cache_dir):
-        """Create a cache service with temp directory"""
-        return DeltaCacheService(cache_dir=temp_cache_dir)
+    def cache_service(self, cache_dir):
+        """Create a cache service with in-memory cache directory"""
+        return DeltaCacheService(cache_dir=cache_dir)
 
     def test_get_token_returns_none_when_no_cache(self, cache_service):
         """Test get_token returns None when no cache exists"""
         result = cache_service.get_token("inbox")
         assert result is None
 
-    def test_save_and_get_token(self, cache_service):
-        """Test saving and retrieving a delta token"""
-        delta_link = "https://graph.microsoft.com/v1.0/me/mailFolders/inbox/messages/delta?$deltatoken=abc123"
-
-        cache_service.save_token("inbox", delta_link)
-        result = cache_service.get_token("inbox")
-
-        assert result == delta_link
-
-    def test_save_token_creates_file(self, cache_service, temp_cache_dir):
+    @pytest.mark.parametrize(
+        "writes,expected",
+        [
+            pytest.param(
+                [("inbox", INBOX_DELTA_LINK)],
+                {"inbox": INBOX_DELTA_LINK},
+                id="save_and_get",
+            ),
+            pytest.param(
+                [
+                    ("inbox", "https://example.com/old"),
+                    ("inbox", "https://example.com/new"),
+                ],
+                {"inbox": "https://example.com/new"},
+                id="overwrite_existing",
+            ),
+            pytest.param(
+                [
+                    ("inbox", "https://example.com/inbox"),
+                    ("sent", "https://example.com/sent"),
+                ],
+                {
+                    "inbox": "https://example.com/inbox",
+                    "sent": "https://example.com/sent",
+                },
+                id="multiple_folders_independent",
+            ),
+        ],
+    )
+    def test_save_and_get_token(self, cache_service, writes, expected):
+        """Test saved delta tokens round-trip per folder, last write wins"""
+        for folder_id, delta_link in writes:
+            cache_service.save_token(folder_id, delta_link)
+
+        for folder_id, delta_link in expected.items():
+            assert cache_service.get_token(folder_id) == delta_link
+
+    def test_save_token_creates_file(self, cache_service, cache_dir):
         """Test save_token creates a JSON file"""
         delta_link = "https://example.com/delta?token=xyz"
 
         cache_service.save_token("inbox", delta_link)
 
-        cache_file = temp_cache_dir / "inbox.json"
+        cache_file = cache_dir / "inbox.json"
         assert cache_file.exists()
 
         with open(cache_file) as f:
@@ -52,14 +80,14 @@ class TestDeltaCacheService:
             assert "updated_at" in data
             assert data["folder_id"] == "inbox"
 
-    def test_clear_token_removes_cache(self, cache_service, temp_cache_dir):
+    def test_clear_token_removes_cache(self, cache_service, cache_dir):
         """Test clear_token removes the cache file"""
         cache_service.save_token("inbox", "https://example.com/delta")
 
         result = cache_service.clear_token("inbox")
 
         assert result is True
-        assert not (temp_cache_dir / "inbox.json").exists()
+        assert not (cache_dir / "inbox.json").exists()
         assert cache_service.get_token("inbox") is None
 
     def test_clear_token_returns_false_when_no_cache(self, cache_service):
@@ -67,7 +95,7 @@ class TestDeltaCacheService:
         result = cache_service.clear_token("nonexistent")
         assert result is False
 
-    def test_clear_all_removes_all_caches(self, cache_service, temp_cache_dir):
+    def test_clear_all_removes_all_caches(self, cache_service, cache_dir):
         """Test clear_all removes all cache files"""
         cache_service.save_token("inbox", "https://example.com/inbox")
         cache_service.save_token("sent", "https://example.com/sent")
@@ -97,44 +125,43 @@ class TestDeltaCacheService:
         info = cache_service.get_cache_info("nonexistent")
         assert info is None
 
-    def test_folder_id_sanitization(self, cache_service, temp_cache_dir):
+    def test_folder_id_sanitization(self, cache_service, cache_dir):
         """Test folder IDs with special characters are sanitized"""
         # Folder IDs with slashes should be sanitized
         cache_service.save_token("folder/with/slashes", "https://example.com/delta")
 
         # Should create a file with sanitized name
-        cache_file = temp_cache_dir / "folder_with_slashes.json"
+        cache_file = cache_dir / "folder_with_slashes.json"
         assert cache_file.exists()
 
         # Should be retrievable with original ID
         result = cache_service.get_token("folder/with/slashes")
         assert result == "https://example.com/delta"
 
-    def test_corrupted_cache_file_returns_none(self, cache_service, temp_cache_dir):
+    def test_corrupted_cache_file_returns_none(self, cache_service, cache_dir):
         """Test corrupted cache file is handled gracefully"""
-        cache_file = temp_cache_dir / "inbox.json"
+        cache_file = cache_dir / "inbox.json"
         cache_file.write_text("not valid json {{{")
 
         result = cache_service.get_token("inbox")
         assert result is None
 
-    def test_multiple_folders_independent(self, cache_service):
-        """Test multiple folders have independent caches"""
+    def test_clear_token_keeps_other_folders(self, cache_service):
+        """Test clearing one folder doesn't affect the others"""
         cache_service.save_token("inbox", "https://example.com/inbox")
         cache_service.save_token("sent", "https://example.com/sent")
 
-        assert cache_service.get_token("inbox") == "https://example.com/inbox"
-        assert cache_service.get_token("sent") == "https://example.com/sent"
-
-        # Clearing one doesn't affect the other
         cache_service.clear_token("inbox")
+
         assert cache_service.get_token("inbox") is None
         assert cache_service.get_token("sent") == "https://example.com/sent"
 
-    def test_overwrite_existing_token(self, cache_service):
-        """Test saving a new token overwrites the old one"""
-        cache_service.save_token("inbox", "https://example.com/old")
-        cache_service.save_token("inbox", "https://example.com/new")
+    def test_round_trip_on_real_filesystem(self, tmp_path):
+        """Smoke test against the real filesystem (the rest use pyfakefs)"""
+        cache_service = DeltaCacheService(cache_dir=tmp_path / "delta")
 
-        result = cache_service.get_token("inbox")
-        assert result == "https://example.com/new"
+        cache_service.save_token("inbox", INBOX_DELTA_LINK)
+
+        assert (tmp_path / "delta" / "inbox.json").exists()
+        assert cache_service.get_token("inbox") == INBOX_DELTA_LINK
+        assert cache_service.clear_token("inbox") is True
@@ -24,6 +24,7 @@ class TestGraphService:
         self.mock_auth_service = MagicMock()
         self.service = GraphService(auth_service=self.mock_auth_service)
 
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_get_client_creates_new_client(self):
         """Should create a new Graph client on first call"""
         # Setup mock credential
@@ -41,6 +42,7 @@ class TestGraphService:
         assert isinstance(client, GraphServiceClient)
         assert self.service._client is not None
 
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_get_client_returns_cached_client(self):
         """Should return cached client on subsequent calls"""
         # Setup mock credential
@@ -59,6 +61,7 @@ class TestGraphService:
         # Verify same client instance is returned
         assert client1 is client2
 
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_get_user_info(self):
         """Should fetch user info using Graph client"""
         # Setup mock credential
@@ -91,6 +94,7 @@ class TestGraphService:
         service = GraphService(auth_service=mock_auth)
         assert service._client is None
 
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_get_client_with_auth_failure(self):
         """Should propagate authentication errors"""
         # Setup mock to raise an error
@@ -1,94 +1,188 @@
 """Unit tests for MailService"""
 
+from __future__ import annotations
+
+from collections import namedtuple
+from dataclasses import dataclass, replace
 from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, List, Optional
 from unittest.mock import MagicMock
 
-from app.services.mail_service import MailService, WELL_KNOWN_FOLDERS
+import pytest
+from hypothesis import example, given, settings
+from hypothesis import strategies as st
+
+# Keep the module-scoped MailService on one worker under `-n auto --dist=loadgroup`
+pytestmark = pytest.mark.xdist_group("mail_service")
+
+if TYPE_CHECKING:
+    from app.services.mail_service import MailService
+
 
+@pytest.fixture(scope="session")
+def mail_service_module():
+    """Import app.services.mail_service (and the Graph SDK) on first use only."""
+    from app.services import mail_service
 
-def _create_mail_service() -> MailService:
+    return mail_service
+
+
+def _create_mail_service(mail_service_cls: type[MailService]) -> MailService:
     """Create a MailService with mock dependencies."""
     mock_graph_service = MagicMock()
     mock_delta_cache_service = MagicMock()
-    return MailService(
+    return mail_service_cls(
         graph_service=mock_graph_service,
         delta_cache_service=mock_delta_cache_service,
     )
 
 
-class TestBuildRecipients:
-    """Tests for MailService._build_recipients method"""
+@pytest.fixture(scope="module")
+def service(mail_service_module) -> MailService:
+    """Shared MailService; the helpers under test are stateless."""
+    return _create_mail_service(mail_service_module.MailService)
+
+
+@dataclass(frozen=True, slots=True)
+class MessageStub:
+    """Read-only stand-in for a Kiota Message; defaults form a minimal message."""
+
+    id: str = "msg-123"
+    subject: str = "Test"
+    body_preview: str = ""
+    is_draft: bool = True
+    is_read: bool = False
+    web_link: Optional[str] = None
+    body: Any = None
+    to_recipients: Optional[List[Any]] = None
+    cc_recipients: Optional[List[Any]] = None
+    bcc_recipients: Optional[List[Any]] = None
+    from_: Any = None
+    importance: Optional[str] = None
+    created_date_time: Optional[datetime] = None
+    last_modified_date_time: Optional[datetime] = None
+    received_date_time: Optional[datetime] = None
+    sent_date_time: Optional[datetime] = None
+    has_attachments: Optional[bool] = None
+    conversation_id: Optional[str] = None
+    categories: Optional[List[str]] = None
+
+
+@dataclass(frozen=True, slots=True)
+class BodyStub:
+    """Read-only stand-in for a Kiota ItemBody."""
 
-    def setup_method(self):
-        self.service = _create_mail_service()
+    content_type: str
+    content: str
 
-    def test_single_recipient_with_name(self):
-        """Test building single recipient with name"""
-        recipients = [{"address": "john@example.com", "name": "John Doe"}]
 
-        result = self.service._build_recipients(recipients)
+MINIMAL_MESSAGE = MessageStub()
 
-        assert len(result) == 1
-        assert result[0].email_address.address == "john@example.com"
-        assert result[0].email_address.name == "John Doe"
 
-    def test_single_recipient_without_name(self):
-        """Test building single recipient without name"""
-        recipients = [{"address": "john@example.com"}]
+# Read-only stand-ins for Kiota Recipient / EmailAddress
+EmailAddressStub = namedtuple("EmailAddressStub", ["name", "address"])
+RecipientStub = namedtuple("RecipientStub", ["email_address"])
 
-        result = self.service._build_recipients(recipients)
 
-        assert len(result) == 1
-        assert result[0].email_address.address == "john@example.com"
-        assert result[0].email_address.name is None
+# Recipient input dicts as accepted by create_draft ("name" is optional)
+RECIPIENT_DICTS = st.fixed_dictionaries(
+    {"address": st.emails()}, optional={"name": st.text()}
+)
 
-    def test_multiple_recipients(self):
-        """Test building multiple recipients"""
-        recipients = [
+SINGLE_MESSAGE = {
+    "subject": "Test Email",
+    "from": {
+        "emailAddress": {
+            "name": "John Doe",
+            "address": "john@example.com",
+        }
+    },
+    "receivedDateTime": "2025-12-05T10:00:00Z",
+    "bodyPreview": "This is a test email preview.",
+    "webLink": "https://outlook.com/mail/123",
+}
+
+SINGLE_MESSAGE_TANA = "\n".join(
+    [
+        "%%tana%%",
+        "- Test Email #email",
+        "  - From:: John Doe",
+        "  - Received:: [[date:2025-12-05T10:00:00Z]]",
+        "  - Preview:: This is a test email preview.",
+        "  - Link:: https://outlook.com/mail/123",
+    ]
+)
+
+# Body preview longer than format_as_tana's 200-char cut-off
+LONG_PREVIEW = "A" * 300
+TRUNCATED_PREVIEW = "A" * 200
+
+# Well-known folder names accepted by the API, and the Graph IDs they map to
+EXPECTED_FOLDER_NAMES = frozenset(
+    {
+        "inbox",
+        "drafts",
+        "sent",
+        "sentitems",
+        "deleted",
+        "deleteditems",
+        "junk",
+        "junkemail",
+        "archive",
+        "outbox",
+    }
+)
+VALID_FOLDER_IDS = frozenset(
+    {
+        "inbox",
+        "drafts",
+        "sentitems",
+        "deleteditems",
+        "junkemail",
+        "archive",
+        "outbox",
+    }
+)
+
+
+class TestBuildRecipients:
+    """Tests for MailService._build_recipients method"""
+
+    @settings(max_examples=10)
+    @given(recipients=st.lists(RECIPIENT_DICTS, max_size=5))
+    @example(recipients=[{"address": "john@example.com", "name": "John Doe"}])
+    @example(recipients=[{"address": "john@example.com"}])
+    @example(
+        recipients=[
             {"address": "john@example.com", "name": "John Doe"},
             {"address": "jane@example.com", "name": "Jane Doe"},
             {"address": "bob@example.com"},
         ]
+    )
+    @example(recipients=[])
+    def test_build_recipients(self, service, recipients):
+        """Test recipient dicts become Kiota recipients in order"""
+        result = service._build_recipients(recipients)
 
-        result = self.service._build_recipients(recipients)
-
-        assert len(result) == 3
-        assert result[0].email_address.address == "john@example.com"
-        assert result[1].email_address.address == "jane@example.com"
-        assert result[2].email_address.address == "bob@example.com"
-
-    def test_empty_recipients(self):
-        """Test building empty recipients list"""
-        result = self.service._build_recipients([])
-
-        assert len(result) == 0
+        assert len(result) == len(recipients)
+        for recipient, expected in zip(result, recipients):
+            assert recipient.email_address.address == expected["address"]
+            assert recipient.email_address.name == expected.get("name")
 
 
 class TestMessageToDict:
     """Tests for MailService._message_to_dict method"""
 
-    def setup_method(self):
-        self.service = _create_mail_service()
-
-    def test_basic_fields(self):
+    def test_basic_fields(self, service):
         """Test basic message fields are converted"""
-        message = MagicMock()
-        message.id = "msg-123"
-        message.subject = "Test Subject"
-        message.body_preview = "Preview text"
-        message.is_draft = True
-        message.is_read = False
-        message.web_link = "https://outlook.com/mail/123"
-        message.body = None
-        message.to_recipients = None
-        message.cc_recipients = None
-        message.bcc_recipients = None
-        message.from_ = None
-        message.importance = None
-        message.created_date_time = None
-        message.last_modified_date_time = None
-
-        result = self.service._message_to_dict(message)
+        message = replace(
+            MINIMAL_MESSAGE,
+            subject="Test Subject",
+            body_preview="Preview text",
+            web_link="https://outlook.com/mail/123",
+        )
+
+        result = service._message_to_dict(message)
 
         assert result["id"] == "msg-123"
         assert result["subject"] == "Test Subject"
@@ -97,28 +191,28 @@ class TestMessageToDict:
         assert result["isRead"] is False
         assert result["webLink"] == "https://outlook.com/mail/123"
 
-    def test_body_conversion(self):
+    def test_body_conversion(self, service):
         """Test body field conversion"""
-        message = self._make_minimal_message()
-        message.body = MagicMock()
-        message.body.content_type = "html"
-        message.body.content = "<p>Hello world</p>"
+        message = replace(
+            MINIMAL_MESSAGE,
+            body=BodyStub(content_type="html", content="<p>Hello world</p>"),
+        )
 
-        result = self.service._message_to_dict(message)
+        result = service._message_to_dict(message)
 
         assert result["body"]["contentType"] == "html"
         assert result["body"]["content"] == "<p>Hello world</p>"
 
-    def test_to_recipients_conversion(self):
+    def test_to_recipients_conversion(self, service):
         """Test toRecipients field conversion"""
-        message = self._make_minimal_message()
-        recipient = MagicMock()
-        recipient.email_address = MagicMock()
-        recipient.email_address.name = "John Doe"
-        recipient.email_address.address = "john@example.com"
-        message.to_recipients = [recipient]
+        message = replace(
+            MINIMAL_MESSAGE,
+            to_recipients=[
+                RecipientStub(EmailAddressStub("John Doe", "john@example.com"))
+            ],
+        )
 
-        result = self.service._message_to_dict(message)
+        result = service._message_to_dict(message)
 
         assert len(result["toRecipients"]) == 1
         assert result["toRecipients"][0]["emailAddress"]["name"] == "John Doe"
@@ -126,30 +220,30 @@ class TestMessageToDict:
             result["toRecipients"][0]["emailAddress"]["address"] == "john@example.com"
         )
 
-    def test_cc_recipients_conversion(self):
+    def test_cc_recipients_conversion(self, service):
         """Test ccRecipients field conversion"""
-        message = self._make_minimal_message()
-        recipient = MagicMock()
-        recipient.email_address = MagicMock()
-        recipient.email_address.name = "Jane Doe"
-        recipient.email_address.address = "jane@example.com"
-        message.cc_recipients = [recipient]
+        message = replace(
+            MINIMAL_MESSAGE,
+            cc_recipients=[
+                RecipientStub(EmailAddressStub("Jane Doe", "jane@example.com"))
+            ],
+        )
 
-        result = self.service._message_to_dict(message)
+        result = service._message_to_dict(message)
 
         assert len(result["ccRecipients"]) == 1
         assert result["ccRecipients"][0]["emailAddress"]["name"] == "Jane Doe"
 
-    def test_bcc_recipients_conversion(self):
+    def test_bcc_recipients_conversion(self, service):
         """Test bccRecipients field conversion"""
-        message = self._make_minimal_message()
-        recipient = MagicMock()
-        recipient.email_address = MagicMock()
-        recipient.email_address.name = "Secret"
-        recipient.email_address.address = "secret@example.com"
-        message.bcc_recipients = [recipient]
+        message = replace(
+            MINIMAL_MESSAGE,
+            bcc_recipients=[
+                RecipientStub(EmailAddressStub("Secret", "secret@example.com"))
+            ],
+        )
 
-        result = self.service._message_to_dict(message)
+        result = service._message_to_dict(message)
 
         assert len(result["bccRecipients"]) == 1
         assert (
@@ -157,156 +251,99 @@ class TestMessageToDict:
             == "secret@example.com"
         )
 
-    def test_from_conversion(self):
+    def test_from_conversion(self, service):
         """Test from field conversion"""
-        message = self._make_minimal_message()
-        message.from_ = MagicMock()
-        message.from_.email_address = MagicMock()
-        message.from_.email_address.name = "Sender"
-        message.from_.email_address.address = "sender@example.com"
+        message = replace(
+            MINIMAL_MESSAGE,
+            from_=RecipientStub(EmailAddressStub("Sender", "sender@example.com")),
+        )
 
-        result = self.service._message_to_dict(message)
+        result = service._message_to_dict(message)
 
         assert result["from"]["emailAddress"]["name"] == "Sender"
         assert result["from"]["emailAddress"]["address"] == "sender@example.com"
 
-    def test_importance_conversion(self):
+    def test_importance_conversion(self, service):
         """Test importance field conversion"""
-        message = self._make_minimal_message()
-        message.importance = "high"
+        message = replace(MINIMAL_MESSAGE, importance="high")
 
-        result = self.service._message_to_dict(message)
+        result = service._message_to_dict(message)
 
         assert result["importance"] == "high"
 
-    def test_timestamps_conversion(self):
+    def test_timestamps_conversion(self, service):
         """Test timestamp fields conversion"""
-        message = self._make_minimal_message()
-        message.created_date_time = datetime(2025, 12, 5, 10, 0, 0, tzinfo=timezone.utc)
-        message.last_modified_date_time = datetime(
-            2025, 12, 5, 11, 0, 0, tzinfo=timezone.utc
+        created = datetime(2025, 12, 5, 10, 0, 0, tzinfo=timezone.utc)
+        modified = datetime(2025, 12, 5, 11, 0, 0, tzinfo=timezone.utc)
+        message = replace(
+            MINIMAL_MESSAGE,
+            created_date_time=created,
+            last_modified_date_time=modified,
         )
 
-        result = self.service._message_to_dict(message)
+        result = service._message_to_dict(message)
 
-        assert "2025-12-05" in result["createdDateTime"]
-        assert "2025-12-05" in result["lastModifiedDateTime"]
+        # Rendered in the local offset, so compare instants rather than text
+        assert datetime.fromisoformat(result["createdDateTime"]) == created
+        assert datetime.fromisoformat(result["lastModifiedDateTime"]) == modified
 
-    def test_null_email_address_in_recipient(self):
+    def test_null_email_address_in_recipient(self, service):
         """Test handling null email_address in recipient"""
-        message = self._make_minimal_message()
-        recipient = MagicMock()
-        recipient.email_address = None
-        message.to_recipients = [recipient]
+        message = replace(MINIMAL_MESSAGE, to_recipients=[RecipientStub(None)])
 
-        result = self.service._message_to_dict(message)
+        result = service._message_to_dict(message)
 
         assert result["toRecipients"][0]["emailAddress"]["name"] is None
         assert result["toRecipients"][0]["emailAddress"]["address"] is None
 
-    def _make_minimal_message(self):
-        """Create a minimal mock message with all required fields"""
-        message = MagicMock()
-        message.id = "msg-123"
-        message.subject = "Test"
-        message.body_preview = ""
-        message.is_draft = True
-        message.is_read = False
-        message.web_link = None
-        message.body = None
-        message.to_recipients = None
-        message.cc_recipients = None
-        message.bcc_recipients = None
-        message.from_ = None
-        message.importance = None
-        message.created_date_time = None
-        message.last_modified_date_time = None
-        message.received_date_time = None
-        message.sent_date_time = None
-        message.has_attachments = None
-        message.conversation_id = None
-        return message
-
 
 class TestResolveFolderId:
     """Tests for MailService._resolve_folder_id method"""
 
-    def setup_method(self):
-        self.service = _create_mail_service()
-
-    def test_well_known_folder_inbox(self):
-        """Test inbox folder resolution"""
-        assert self.service._resolve_folder_id("inbox") == "inbox"
-        assert self.service._resolve_folder_id("INBOX") == "inbox"
-        assert self.service._resolve_folder_id("Inbox") == "inbox"
-
-    def test_well_known_folder_sent(self):
-        """Test sent folder resolution"""
-        assert self.service._resolve_folder_id("sent") == "sentitems"
-        assert self.service._resolve_folder_id("sentitems") == "sentitems"
-
-    def test_well_known_folder_deleted(self):
-        """Test deleted folder resolution"""
-        assert self.service._resolve_folder_id("deleted") == "deleteditems"
-        assert self.service._resolve_folder_id("deleteditems") == "deleteditems"
-
-    def test_well_known_folder_junk(self):
-        """Test junk folder resolution"""
-        assert self.service._resolve_folder_id("junk") == "junkemail"
-        assert self.service._resolve_folder_id("junkemail") == "junkemail"
-
-    def test_custom_folder_id_passthrough(self):
-        """Test custom folder IDs are passed through unchanged"""
-        custom_id = "AAMkAGI2TG93AAA="
-        assert self.service._resolve_folder_id(custom_id) == custom_id
+    @pytest.mark.parametrize(
+        "folder_id,expected",
+        [
+            ("inbox", "inbox"),
+            ("INBOX", "inbox"),
+            ("Inbox", "inbox"),
+            ("sent", "sentitems"),
+            ("sentitems", "sentitems"),
+            ("deleted", "deleteditems"),
+            ("deleteditems", "deleteditems"),
+            ("junk", "junkemail"),
+            ("junkemail", "junkemail"),
+            # Custom folder IDs are passed through unchanged
+            ("AAMkAGI2TG93AAA=", "AAMkAGI2TG93AAA="),
+        ],
+    )
+    def test_resolve_folder_id(self, service, folder_id, expected):
+        """Test well-known folder names resolve to MS Graph folder IDs"""
+        assert service._resolve_folder_id(folder_id) == expected
 
 
 class TestFormatAsTana:
     """Tests for MailService.format_as_tana method"""
 
-    def setup_method(self):
-        self.service = _create_mail_service()
-
-    def test_empty_messages(self):
+    def test_empty_messages(self, service):
         """Test formatting empty message list"""
-        result = self.service.format_as_tana([])
+        result = service.format_as_tana([])
         assert result == "%%tana%%\n- No messages found"
 
-    def test_single_message(self):
+    def test_single_message(self, service):
         """Test formatting single message"""
-        messages = [
-            {
-                "subject": "Test Email",
-                "from": {
-                    "emailAddress": {
-                        "name": "John Doe",
-                        "address": "john@example.com",
-                    }
-                },
-                "receivedDateTime": "2025-12-05T10:00:00Z",
-                "bodyPreview": "This is a test email preview.",
-                "webLink": "https://outlook.com/mail/123",
-            }
-        ]
-
-        result = self.service.format_as_tana(messages)
+        result = service.format_as_tana([SINGLE_MESSAGE])
 
-        assert "%%tana%%" in result
-        assert "- Test Email #email" in result
-        assert "From:: John Doe" in result
-        assert "Received:: [[date:2025-12-05T10:00:00Z]]" in result
-        assert "Preview:: This is a test email preview." in result
-        assert "Link:: https://outlook.com/mail/123" in result
+        assert result == SINGLE_MESSAGE_TANA
 
-    def test_message_without_subject(self):
+    def test_message_without_subject(self, service):
         """Test formatting message without subject"""
         messages = [{"from": {"emailAddress": {"name": "Sender"}}}]
 
-        result = self.service.format_as_tana(messages)
+        result = service.format_as_tana(messages)
 
         assert "- (No subject) #email" in result
 
-    def test_message_with_address_only(self):
+    def test_message_with_address_only(self, service):
         """Test formatting message with email address but no name"""
         messages = [
             {
@@ -320,86 +357,61 @@ class TestFormatAsTana:
             }
         ]
 
-        result = self.service.format_as_tana(messages)
+        result = service.format_as_tana(messages)
 
         assert "From:: sender@example.com" in result
 
-    def test_deleted_messages_skipped(self):
+    def test_deleted_messages_skipped(self, service):
         """Test that deleted messages are skipped in Tana output"""
         messages = [
             {"subject": "Normal Email"},
             {"subject": "Deleted Email", "@removed": {"reason": "deleted"}},
         ]
 
-        result = self.service.format_as_tana(messages)
+        result = service.format_as_tana(messages)
 
         assert "Normal Email" in result
         assert "Deleted Email" not in result
 
-    def test_custom_tag(self):
+    def test_custom_tag(self, service):
         """Test custom tag parameter"""
         messages = [{"subject": "Test"}]
 
-        result = self.service.format_as_tana(messages, tag="inbox")
+        result = service.format_as_tana(messages, tag="inbox")
 
         assert "- Test #inbox" in result
 
-    def test_long_preview_truncated(self):
+    def test_long_preview_truncated(self, service):
         """Test that long body previews are truncated"""
-        long_preview = "A" * 300
-        messages = [{"subject": "Test", "bodyPreview": long_preview}]
+        messages = [{"subject": "Test", "bodyPreview": LONG_PREVIEW}]
 
-        result = self.service.format_as_tana(messages)
+        result = service.format_as_tana(messages)
 
         # Should be truncated to 200 chars + "..."
-        assert "A" * 200 in result
+        assert TRUNCATED_PREVIEW in result
         assert "..." in result
 
-    def test_preview_newlines_removed(self):
+    def test_preview_newlines_removed(self, service):
         """Test that newlines in preview are replaced"""
         messages = [{"subject": "Test", "bodyPreview": "Line1\nLine2\rLine3"}]
 
-        result = self.service.format_as_tana(messages)
+        result = service.format_as_tana(messages)
 
         # \n becomes space, \r is removed
         assert "Line1 Line2Line3" in result
         # No raw newlines in the preview line itself
-        preview_line = [line for line in result.split("\n") if "Preview::" in line][0]
+        _, _, after_label = result.partition("Preview:: ")
+        preview_line, _, _ = after_label.partition("\n")
         assert "\r" not in preview_line
 
 
 class TestWellKnownFolders:
     """Tests for WELL_KNOWN_FOLDERS constant"""
 
-    def test_all_folders_defined(self):
+    def test_all_folders_defined(self, mail_service_module):
         """Test all expected folders are defined"""
-        expected = [
-            "inbox",
-            "drafts",
-            "sent",
-            "sentitems",
-            "deleted",
-            "deleteditems",
-            "junk",
-            "junkemail",
-            "archive",
-            "outbox",
-        ]
+        assert EXPECTED_FOLDER_NAMES <= mail_service_module.WELL_KNOWN_FOLDERS.keys()
 
-        for folder in expected:
-            assert folder in WELL_KNOWN_FOLDERS
-
-    def test_folder_values_are_valid(self):
+    def test_folder_values_are_valid(self, mail_service_module):
         """Test all folder values are valid MS Graph folder IDs"""
-        valid_ids = {
-            "inbox",
-            "drafts",
-            "sentitems",
-            "deleteditems",
-            "junkemail",
-            "archive",
-            "outbox",
-        }
-
-        for value in WELL_KNOWN_FOLDERS.values():
-            assert value in valid_ids
+        assert set(mail_service_module.WELL_KNOWN_FOLDERS.values()) <= VALID_FOLDER_IDS
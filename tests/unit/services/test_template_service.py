@@ -1,6 +1,8 @@
 """Unit tests for template service"""
 
 import pytest
+from jinja2 import Template, TemplateSyntaxError
+
 from app.services.template_service import TemplateService
 
 
@@ -13,46 +15,46 @@ class TestTemplateServiceInitialization:
         service = TemplateService()
         assert service.env is not None
 
-    def test_custom_filters_registered(self):
+    def test_custom_filters_registered(self, template_service):
         """Should have custom filters registered"""
-        service = TemplateService()
-        assert "clean" in service.env.filters
-        assert "truncate" in service.env.filters
-        assert "date_format" in service.env.filters
+        assert "clean" in template_service.env.filters
+        assert "truncate" in template_service.env.filters
+        assert "date_format" in template_service.env.filters
 
 
 @pytest.mark.unit
 class TestTemplateServiceRendering:
     """Tests for template rendering"""
 
-    def test_render_simple_template(self):
+    def test_render_simple_template(self, template_service):
         """Should render simple template with events"""
-        service = TemplateService()
         events = [
             {"title": "Meeting 1", "location": "Room A"},
             {"title": "Meeting 2", "location": "Room B"},
         ]
         template = "{% for event in events %}{{event.title}} at {{event.location}}\n{% endfor %}"
 
-        result = service.render_template(template, events, "2025-10-09", "2025-10-10")
+        result = template_service.render_template(
+            template, events, "2025-10-09", "2025-10-10"
+        )
 
         assert "Meeting 1 at Room A" in result
         assert "Meeting 2 at Room B" in result
 
-    def test_render_with_context_variables(self):
+    def test_render_with_context_variables(self, template_service):
         """Should provide context variables (count, start_date, end_date)"""
-        service = TemplateService()
         events = [{"title": "Event 1"}, {"title": "Event 2"}]
         template = "Total: {{count}} events from {{start_date}} to {{end_date}}"
 
-        result = service.render_template(template, events, "2025-10-09", "2025-10-10")
+        result = template_service.render_template(
+            template, events, "2025-10-09", "2025-10-10"
+        )
 
         assert "Total: 2 events" in result
         assert "from 2025-10-09 to 2025-10-10" in result
 
-    def test_render_with_conditionals(self):
+    def test_render_with_conditionals(self, template_service):
         """Should handle conditional statements"""
-        service = TemplateService()
         events = [
             {"title": "Meeting", "location": "Room A"},
             {"title": "Call", "location": ""},
@@ -61,16 +63,17 @@ class TestTemplateServiceRendering:
 {{event.title}}{% if event.location %} - {{event.location}}{% endif %}
 {% endfor %}"""
 
-        result = service.render_template(template, events, "2025-10-09", "2025-10-10")
+        result = template_service.render_template(
+            template, events, "2025-10-09", "2025-10-10"
+        )
 
         assert "Meeting - Room A" in result
         assert "Call" in result
         # "Call" should not have location appended
         assert "Call -" not in result
 
-    def test_render_with_nested_loops(self):
+    def test_render_with_nested_loops(self, template_service):
         """Should handle nested loops (e.g., attendees)"""
-        service = TemplateService()
         events = [
             {
                 "title": "Team Meeting",
@@ -82,31 +85,35 @@ class TestTemplateServiceRendering:
 {% for attendee in event.attendees %}  - {{attendee}}
 {% endfor %}{% endfor %}"""
 
-        result = service.render_template(template, events, "2025-10-09", "2025-10-10")
+        result = template_service.render_template(
+            template, events, "2025-10-09", "2025-10-10"
+        )
 
         assert "Team Meeting:" in result
         assert "- Alice" in result
         assert "- Bob" in result
         assert "- Charlie" in result
 
-    def test_render_empty_events(self):
+    def test_render_empty_events(self, template_service):
         """Should handle empty events list"""
-        service = TemplateService()
         template = (
             "{% for event in events %}{{event.title}}{% endfor %}Count: {{count}}"
         )
 
-        result = service.render_template(template, [], "2025-10-09", "2025-10-10")
+        result = template_service.render_template(
+            template, [], "2025-10-09", "2025-10-10"
+        )
 
         assert "Count: 0" in result
 
-    def test_render_with_empty_field_values(self):
+    def test_render_with_empty_field_values(self, template_service):
         """Should render empty string for empty field values"""
-        service = TemplateService()
         events = [{"title": "Meeting", "location": ""}]
         template = "{{events[0].title}} - {{events[0].location}}"
 
-        result = service.render_template(template, events, "2025-10-09", "2025-10-10")
+        result = template_service.render_template(
+            template, events, "2025-10-09", "2025-10-10"
+        )
 
         assert result == "Meeting - "
 
@@ -115,40 +122,43 @@ class TestTemplateServiceRendering:
 class TestTemplateServiceErrors:
     """Tests for error handling"""
 
-    def test_undefined_variable_renders_empty(self):
+    def test_undefined_variable_renders_empty(self, template_service):
         """Should render empty string for undefined variables (lenient mode)"""
-        service = TemplateService()
         events = [{"title": "Meeting"}]
         template = "{{events[0].title}} at {{events[0].nonexistent_field}}"
 
-        result = service.render_template(template, events, "2025-10-09", "2025-10-10")
+        result = template_service.render_template(
+            template, events, "2025-10-09", "2025-10-10"
+        )
 
         # Missing fields render as empty string instead of raising error
         assert result == "Meeting at "
 
-    def test_invalid_template_syntax_raises_error(self):
+    def test_invalid_template_syntax_raises_error(self, template_service):
         """Should raise TemplateError for invalid template syntax"""
         from app.exceptions import TemplateError
 
-        service = TemplateService()
         events = []
         template = "{% for event in events %}{{event.title}}"  # Missing endfor
 
         with pytest.raises(TemplateError) as exc_info:
-            service.render_template(template, events, "2025-10-09", "2025-10-10")
+            template_service.render_template(
+                template, events, "2025-10-09", "2025-10-10"
+            )
 
         assert "Template syntax error" in str(exc_info.value)
 
-    def test_invalid_jinja_expression_raises_error(self):
+    def test_invalid_jinja_expression_raises_error(self, template_service):
         """Should raise TemplateError for invalid Jinja expression"""
         from app.exceptions import TemplateError
 
-        service = TemplateService()
         events = [{"title": "Meeting"}]
         template = "{{events[0].title | invalid_filter}}"
 
         with pytest.raises(TemplateError) as exc_info:
-            service.render_template(template, events, "2025-10-09", "2025-10-10")
+            template_service.render_template(
+                template, events, "2025-10-09", "2025-10-10"
+            )
 
         # Invalid filter raises TemplateSyntaxError which becomes "Template syntax error"
         assert "Template syntax error" in str(exc_info.value)
@@ -158,189 +168,158 @@ class TestTemplateServiceErrors:
 class TestCustomFilters:
     """Tests for custom Jinja2 filters"""
 
-    def test_clean_filter(self):
-        """Should clean description text"""
-        service = TemplateService()
-        events = [
-            {
-                "title": "Meeting",
-                "description": "<p>This is a meeting</p>\n\nJoin: https://teams.microsoft.com/meet/123",
-            }
-        ]
-        template = "{{events[0].description | clean}}"
-
-        result = service.render_template(template, events, "2025-10-09", "2025-10-10")
-
-        # Should remove HTML but preserve meeting links
-        assert "<p>" not in result
-        assert "https://teams.microsoft.com" in result
-        assert "This is a meeting" in result
-
-    def test_clean_filter_with_empty_string(self):
-        """Should handle empty string in clean filter"""
-        service = TemplateService()
-        events = [{"title": "Meeting", "description": ""}]
-        template = "{{events[0].description | clean}}"
-
-        result = service.render_template(template, events, "2025-10-09", "2025-10-10")
-
-        assert result == ""
-
-    def test_truncate_filter(self):
-        """Should truncate text to specified length"""
-        service = TemplateService()
-        events = [{"title": "Meeting", "description": "A" * 200}]
-        template = "{{events[0].description | truncate(50)}}"
-
-        result = service.render_template(template, events, "2025-10-09", "2025-10-10")
-
-        assert len(result) <= 53  # 50 + "..."
-        assert result.endswith("...")
-
-    def test_truncate_filter_short_text(self):
-        """Should not truncate text shorter than limit"""
-        service = TemplateService()
-        events = [{"title": "Meeting", "description": "Short text"}]
-        template = "{{events[0].description | truncate(50)}}"
-
-        result = service.render_template(template, events, "2025-10-09", "2025-10-10")
-
-        assert result == "Short text"
-        assert not result.endswith("...")
-
-    def test_truncate_filter_with_empty_string(self):
-        """Should handle empty string in truncate filter"""
-        service = TemplateService()
-        events = [{"title": "Meeting", "description": ""}]
-        template = "{{events[0].description | truncate(50)}}"
-
-        result = service.render_template(template, events, "2025-10-09", "2025-10-10")
-
-        assert result == ""
-
-    def test_date_format_filter(self):
-        """Should format datetime strings"""
-        service = TemplateService()
-        events = [{"title": "Meeting", "start": "2025-10-09T10:00:00"}]
-        template = "{{events[0].start | date_format('%Y-%m-%d')}}"
-
-        result = service.render_template(template, events, "2025-10-09", "2025-10-10")
-
-        assert result == "2025-10-09"
-
-    def test_date_format_filter_custom_format(self):
-        """Should use custom format string"""
-        service = TemplateService()
-        events = [{"title": "Meeting", "start": "2025-10-09T14:30:00"}]
-        template = "{{events[0].start | date_format('%H:%M')}}"
-
-        result = service.render_template(template, events, "2025-10-09", "2025-10-10")
-
-        assert result == "14:30"
-
-    def test_date_format_filter_with_empty_string(self):
-        """Should handle empty string in date_format filter"""
-        service = TemplateService()
-        events = [{"title": "Meeting", "start": ""}]
-        template = "{{events[0].start | date_format('%Y-%m-%d')}}"
-
-        result = service.render_template(template, events, "2025-10-09", "2025-10-10")
-
-        assert result == ""
-
-    def test_date_format_filter_invalid_date(self):
-        """Should handle invalid date string gracefully"""
-        service = TemplateService()
-        events = [{"title": "Meeting", "start": "invalid-date"}]
-        template = "{{events[0].start | date_format('%Y-%m-%d')}}"
-
-        result = service.render_template(template, events, "2025-10-09", "2025-10-10")
+    @pytest.mark.parametrize(
+        "template,events,expected",
+        [
+            pytest.param(
+                "{{events[0].description | clean}}",
+                [
+                    {
+                        "title": "Meeting",
+                        "description": "<p>This is a meeting</p>\n\nJoin: https://teams.microsoft.com/meet/123",
+                    }
+                ],
+                # HTML removed, meeting link preserved
+                "This is a meeting Join: https://teams.microsoft.com/meet/123",
+                id="clean",
+            ),
+            pytest.param(
+                "{{events[0].description | clean}}",
+                [{"title": "Meeting", "description": ""}],
+                "",
+                id="clean_empty",
+            ),
+            pytest.param(
+                "{{events[0].description | truncate(50)}}",
+                [{"title": "Meeting", "description": "A" * 200}],
+                "A" * 50 + "...",
+                id="truncate",
+            ),
+            pytest.param(
+                "{{events[0].description | truncate(50)}}",
+                [{"title": "Meeting", "description": "Short text"}],
+                "Short text",
+                id="truncate_short_text",
+            ),
+            pytest.param(
+                "{{events[0].description | truncate(20)}}",
+                [{"title": "Meeting", "description": "Quarterly planning review"}],
+                "Quarterly planning...",
+                id="truncate_word_boundary",
+            ),
+            pytest.param(
+                "{{events[0].description | truncate(50)}}",
+                [{"title": "Meeting", "description": ""}],
+                "",
+                id="truncate_empty",
+            ),
+            pytest.param(
+                "{{events[0].start | date_format('%Y-%m-%d')}}",
+                [{"title": "Meeting", "start": "2025-10-09T10:00:00"}],
+                "2025-10-09",
+                id="date_format",
+            ),
+            pytest.param(
+                "{{events[0].start | date_format('%H:%M')}}",
+                [{"title": "Meeting", "start": "2025-10-09T14:30:00"}],
+                "14:30",
+                id="date_format_custom_format",
+            ),
+            pytest.param(
+                "{{events[0].start | date_format('%Y-%m-%d')}}",
+                [{"title": "Meeting", "start": ""}],
+                "",
+                id="date_format_empty",
+            ),
+            pytest.param(
+                "{{events[0].start | date_format('%Y-%m-%d')}}",
+                [{"title": "Meeting", "start": "invalid-date"}],
+                # Original string is returned if parsing fails
+                "invalid-date",
+                id="date_format_invalid_date",
+            ),
+        ],
+    )
+    def test_filter(self, template_service, template, events, expected):
+        """Should apply the custom filter to the event field"""
+        result = template_service.render_template(
+            template, events, "2025-10-09", "2025-10-10"
+        )
 
-        # Should return original string if parsing fails
-        assert result == "invalid-date"
+        assert result == expected
 
 
 @pytest.mark.unit
 class TestTanaTemplates:
     """Tests for Tana-specific template patterns"""
 
-    def test_tana_basic_structure(self):
-        """Should render basic Tana structure"""
-        service = TemplateService()
-        events = [
-            {
-                "title": "Team Meeting",
-                "start": "2025-10-09T10:00:00",
-                "end": "2025-10-09T11:00:00",
-            }
-        ]
-        template = """%%tana%%
+    @pytest.mark.parametrize(
+        "template,events,expected",
+        [
+            pytest.param(
+                """%%tana%%
 {% for event in events %}- {{event.title}} #meeting
   - Date:: [[date:{{event.start}}/{{event.end}}]]
-{% endfor %}"""
-
-        result = service.render_template(template, events, "2025-10-09", "2025-10-10")
-
-        assert "%%tana%%" in result
-        assert "- Team Meeting #meeting" in result
-        assert "Date:: [[date:2025-10-09T10:00:00/2025-10-09T11:00:00]]" in result
-
-    def test_tana_with_attendees(self):
-        """Should render Tana format with attendees list"""
-        service = TemplateService()
-        events = [
-            {
-                "title": "Review",
-                "attendees": ["Alice", "Bob"],
-            }
-        ]
-        template = """{% for event in events %}- {{event.title}} #meeting
+{% endfor %}""",
+                [
+                    {
+                        "title": "Team Meeting",
+                        "start": "2025-10-09T10:00:00",
+                        "end": "2025-10-09T11:00:00",
+                    }
+                ],
+                "%%tana%%\n"
+                "- Team Meeting #meeting\n"
+                "  - Date:: [[date:2025-10-09T10:00:00/2025-10-09T11:00:00]]\n",
+                id="basic_structure",
+            ),
+            pytest.param(
+                """{% for event in events %}- {{event.title}} #meeting
   - Attendees::
     {% for attendee in event.attendees %}
     - [[{{attendee}} #co-worker]]
     {% endfor %}
-{% endfor %}"""
-
-        result = service.render_template(template, events, "2025-10-09", "2025-10-10")
-
-        assert "- Review #meeting" in result
-        assert "[[Alice #co-worker]]" in result
-        assert "[[Bob #co-worker]]" in result
-
-    def test_tana_with_conditional_fields(self):
-        """Should handle conditional fields in Tana format"""
-        service = TemplateService()
-        events = [
-            {"title": "Meeting", "location": "Room A"},
-            {"title": "Call", "location": ""},
-        ]
-        template = """{% for event in events %}- {{event.title}} #meeting
+{% endfor %}""",
+                [{"title": "Review", "attendees": ["Alice", "Bob"]}],
+                "- Review #meeting\n"
+                "  - Attendees::\n"
+                "    - [[Alice #co-worker]]\n"
+                "    - [[Bob #co-worker]]\n",
+                id="attendees",
+            ),
+            pytest.param(
+                """{% for event in events %}- {{event.title}} #meeting
   {% if event.location %}
   - Location:: [[{{event.location}} #location]]
   {% endif %}
-{% endfor %}"""
-
-        result = service.render_template(template, events, "2025-10-09", "2025-10-10")
-
-        assert "- Meeting #meeting" in result
-        assert "Location:: [[Room A #location]]" in result
-        assert "- Call #meeting" in result
-        lines = result.split("\n")
-        call_idx = next(i for i, line in enumerate(lines) if "Call #meeting" in line)
-        assert (
-            "Location::" not in lines[call_idx + 1]
-            if call_idx + 1 < len(lines)
-            else True
+{% endfor %}""",
+                [
+                    {"title": "Meeting", "location": "Room A"},
+                    {"title": "Call", "location": ""},
+                ],
+                # "Call" has no location, so no Location:: line follows it
+                "- Meeting #meeting\n"
+                "  - Location:: [[Room A #location]]\n"
+                "- Call #meeting\n",
+                id="conditional_fields",
+            ),
+        ],
+    )
+    def test_tana_output(self, template_service, template, events, expected):
+        """Should render the Tana Paste structure exactly"""
+        result = template_service.render_template(
+            template, events, "2025-10-09", "2025-10-10"
         )
 
+        assert result == expected
+
 
 @pytest.mark.unit
 class TestGenericRenderMethod:
     """Tests for the generic render() method"""
 
-    def test_render_with_messages(self):
+    def test_render_with_messages(self, template_service):
         """Should render with messages context"""
-        service = TemplateService()
         messages = [
             {"subject": "Hello", "from": "alice@example.com"},
             {"subject": "World", "from": "bob@example.com"},
@@ -349,78 +328,305 @@ class TestGenericRenderMethod:
             "{% for msg in messages %}{{msg.subject}} from {{msg.from}}\n{% endfor %}"
         )
 
-        result = service.render(template, messages=messages, count=len(messages))
+        result = template_service.render(
+            template, messages=messages, count=len(messages)
+        )
 
         assert "Hello from alice@example.com" in result
         assert "World from bob@example.com" in result
 
-    def test_render_with_arbitrary_context(self):
+    def test_render_with_arbitrary_context(self, template_service):
         """Should render with arbitrary context variables"""
-        service = TemplateService()
         template = "User: {{user_name}}, Folder: {{folder}}"
 
-        result = service.render(template, user_name="John", folder="inbox")
+        result = template_service.render(template, user_name="John", folder="inbox")
 
         assert result == "User: John, Folder: inbox"
 
-    def test_render_undefined_variable_strict(self):
+    def test_render_undefined_variable_strict(self, template_service):
         """Should raise ValueError for undefined variable when accessed directly"""
-        service = TemplateService()
         # This template tries to iterate over undefined variable
         template = "{% for item in undefined_var %}{{item}}{% endfor %}"
 
         # Jinja2 treats undefined as empty iterable, so this won't raise
-        result = service.render(template)
+        result = template_service.render(template)
         assert result == ""
 
-    def test_render_date_format_with_z_suffix(self):
+    def test_render_date_format_with_z_suffix(self, template_service):
         """Should handle date strings with Z suffix"""
-        service = TemplateService()
         template = "{{date | date_format('%Y-%m-%d')}}"
 
-        result = service.render(template, date="2025-12-09T10:00:00Z")
+        result = template_service.render(template, date="2025-12-09T10:00:00Z")
 
         assert result == "2025-12-09"
 
-    def test_render_date_format_with_microseconds(self):
+    def test_render_date_format_with_microseconds(self, template_service):
         """Should handle date strings with .0000000 microseconds"""
-        service = TemplateService()
         template = "{{date | date_format('%Y-%m-%d %H:%M')}}"
 
-        result = service.render(template, date="2025-12-09T10:30:00.0000000")
+        result = template_service.render(template, date="2025-12-09T10:30:00.0000000")
 
         assert result == "2025-12-09 10:30"
 
-    def test_render_date_format_non_iso_string(self):
+    def test_render_date_format_non_iso_string(self, template_service):
         """Should return original string for non-ISO date format"""
-        service = TemplateService()
         template = "{{date | date_format('%Y-%m-%d')}}"
 
-        result = service.render(template, date="December 9, 2025")
+        result = template_service.render(template, date="December 9, 2025")
 
         # No T in string, so returns original
         assert result == "December 9, 2025"
 
-    def test_render_undefined_error_raises_template_error(self):
+    def test_render_undefined_error_raises_template_error(self, template_service):
         """Should raise TemplateError for undefined variable access"""
         from app.exceptions import TemplateError
 
-        service = TemplateService()
         # Force an undefined error by using strict undefined access
         template = "{{ undefined_var.attribute }}"
 
         with pytest.raises(TemplateError) as exc_info:
-            service.render(template)
+            template_service.render(template)
 
         assert "Undefined" in str(exc_info.value) or "undefined" in str(exc_info.value)
 
-    def test_render_date_format_with_invalid_iso(self):
+    def test_render_date_format_with_invalid_iso(self, template_service):
         """Should handle malformed ISO date gracefully"""
-        service = TemplateService()
         template = "{{date | date_format('%Y-%m-%d')}}"
 
         # Has T but invalid format
-        result = service.render(template, date="2025-13-45T99:99:99")
+        result = template_service.render(template, date="2025-13-45T99:99:99")
 
         # Should return original on parse failure
         assert result == "2025-13-45T99:99:99"
+
+
+@pytest.mark.unit
+class TestCompiledTemplateCache:
+    """Tests for reuse of compiled templates across renders"""
+
+    def test_same_source_compiled_once(self):
+        """Should reuse the compiled template for identical source"""
+        service = TemplateService()
+        template = "Hello {{name}}"
+
+        first = service.render(template, name="Alice")
+        second = service.render(template, name="Bob")
+
+        assert first == "Hello Alice"
+        assert second == "Hello Bob"
+        assert list(service._compiled) == [template]
+
+    def test_invalid_template_not_cached(self):
+        """Should not cache templates that fail to compile"""
+        from app.exceptions import TemplateError
+
+        service = TemplateService()
+
+        with pytest.raises(TemplateError):
+            service.render("{% for x in items %}")
+
+        assert service._compiled == {}
+
+    def test_cache_is_bounded(self, monkeypatch):
+        """Should evict the oldest template once the cache is full"""
+        from app.services import template_service
+
+        monkeypatch.setattr(template_service, "MAX_COMPILED_TEMPLATES", 2)
+        service = TemplateService()
+
+        for source in ("a {{x}}", "b {{x}}", "c {{x}}"):
+            service.render(source, x=1)
+
+        assert list(service._compiled) == ["b {{x}}", "c {{x}}"]
+
+    def test_hit_refreshes_entry(self, monkeypatch):
+        """Should evict the least recently used template, not the oldest"""
+        from app.services import template_service
+
+        monkeypatch.setattr(template_service, "MAX_COMPILED_TEMPLATES", 2)
+        service = TemplateService()
+
+        for source in ("a {{x}}", "b {{x}}", "a {{x}}", "c {{x}}"):
+            service.render(source, x=1)
+
+        assert list(service._compiled) == ["a {{x}}", "c {{x}}"]
+
+
+@pytest.mark.unit
+class TestBytecodeCache:
+    """Tests for the on-disk compiled template cache"""
+
+    def test_no_cache_dir_by_default(self):
+        """Should not persist bytecode unless a directory is given"""
+        service = TemplateService()
+        assert service.env.bytecode_cache is None
+
+    def test_bytecode_written_on_precompile(self, tmp_path):
+        """Should write a cache file when a template is precompiled"""
+        service = TemplateService(bytecode_cache_dir=tmp_path)
+
+        template = "Hello {{name | upper}}"
+        service.precompile(template)
+
+        assert service.render(template, name="Alice") == "Hello ALICE"
+        assert len(list(tmp_path.glob("__jinja2_*.cache"))) == 1
+
+    def test_rendered_templates_not_written(self, tmp_path):
+        """Should keep templates first seen in render() in memory only"""
+        service = TemplateService(bytecode_cache_dir=tmp_path)
+
+        for name in ("a", "b", "c"):
+            service.render("{{ %s | upper }}" % name, **{name: "x"})
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_second_instance_reuses_bytecode(self, tmp_path, monkeypatch):
+        """Should load bytecode from disk instead of recompiling"""
+        template = "Hello {{name | upper}}"
+        TemplateService(bytecode_cache_dir=tmp_path).precompile(template)
+
+        service = TemplateService(bytecode_cache_dir=tmp_path)
+
+        def fail_compile(*args, **kwargs):
+            raise AssertionError("template was recompiled")
+
+        monkeypatch.setattr(service.env, "compile", fail_compile)
+        service.precompile(template)
+        assert service.render(template, name="Bob") == "Hello BOB"
+        assert len(list(tmp_path.glob("__jinja2_*.cache"))) == 1
+
+    def test_syntax_error_with_bytecode_cache(self, tmp_path):
+        """Should still raise TemplateError for invalid templates"""
+        from app.exceptions import TemplateError
+
+        service = TemplateService(bytecode_cache_dir=tmp_path)
+
+        with pytest.raises(TemplateError) as exc_info:
+            service.precompile("{% for x in items %}")
+
+        assert "Template syntax error" in str(exc_info.value)
+        assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.unit
+class TestSharedEnvironment:
+    """Tests for reuse of the module-level Jinja2 environment"""
+
+    def test_instances_share_default_environment(self):
+        """Should reuse one environment across default instances"""
+        assert TemplateService().env is TemplateService().env
+
+    def test_bytecode_cache_gets_own_environment(self, tmp_path):
+        """Should build a separate environment when a cache dir is given"""
+        service = TemplateService(bytecode_cache_dir=tmp_path)
+
+        assert service.env is not TemplateService().env
+        assert "clean" in service.env.filters
+
+
+@pytest.mark.unit
+class TestSimpleTemplateFastPath:
+    """Tests for rendering variable-only templates without Jinja"""
+
+    @pytest.mark.parametrize(
+        "template,context",
+        [
+            ("Total: {{count}} events", {"count": 2}),
+            ("{{ start_date }} to {{end_date}}", {"start_date": "a", "end_date": "b"}),
+            ("Missing: {{nope}}", {}),
+            ("Null: {{value}}", {"value": None}),
+            ("Trailing newline {{x}}\n", {"x": 1}),
+            ("Two newlines\n\n", {}),
+            ("Plain text", {}),
+            ("Braces { {x} } and {0}", {"x": 1}),
+            ("", {}),
+        ],
+    )
+    def test_matches_jinja_output(self, template, context):
+        """Should render exactly what Jinja2 would"""
+        service = TemplateService()
+
+        result = service.render(template, **context)
+
+        assert result == service.env.from_string(template).render(**context)
+        assert not isinstance(service._compiled[template], Template)
+
+    @pytest.mark.parametrize(
+        "template",
+        [
+            "{{events[0].title}}",
+            "{{ name | upper }}",
+            "{% if x %}{{x}}{% endif %}",
+            "{# note #}{{x}}",
+            "{{ true }}",
+            "{{ range }}",
+            "line\r\n{{x}}",
+        ],
+    )
+    def test_other_templates_use_jinja(self, template):
+        """Should fall back to Jinja2 for anything beyond bare variables"""
+        service = TemplateService()
+
+        service.render(template, x=1, name="a", events=[{"title": "t"}])
+
+        assert isinstance(service._compiled[template], Template)
+
+    @pytest.mark.parametrize(
+        "template",
+        [
+            "{{not}}",
+            "{{ x }}{{ not }}",
+            "{{{ body }}}",
+            "{{x }}{{{x}}",
+            "{ {{{x}}}",
+        ],
+    )
+    def test_invalid_templates_raise_like_jinja(self, template):
+        """Should reject what Jinja2 rejects instead of rendering text"""
+        from app.exceptions import TemplateError
+
+        service = TemplateService()
+
+        with pytest.raises(TemplateSyntaxError):
+            service.env.from_string(template)
+        with pytest.raises(TemplateError) as exc_info:
+            service.render(template, x=1, body="b")
+
+        assert "Template syntax error" in str(exc_info.value)
+
+
+@pytest.mark.unit
+class TestPrecompile:
+    """Tests for compiling templates ahead of rendering"""
+
+    def test_precompile_populates_cache(self):
+        """Should compile the template without rendering it"""
+        service = TemplateService()
+        template = "{% for e in events %}{{e.title}}{% endfor %}"
+
+        service.precompile(template)
+
+        assert template in service._compiled
+        assert service.render(template, events=[{"title": "A"}]) == "A"
+
+    def test_precompile_invalid_template_raises(self):
+        """Should raise TemplateError for invalid template syntax"""
+        from app.exceptions import TemplateError
+
+        service = TemplateService()
+
+        with pytest.raises(TemplateError) as exc_info:
+            service.precompile("{% if x %}")
+
+        assert "Template syntax error" in str(exc_info.value)
+
+    def test_mcp_default_templates_compile(self):
+        """Should compile every MCP default template"""
+        from app.mcp.default_templates import DEFAULT_TEMPLATES
+
+        service = TemplateService()
+
+        for template in DEFAULT_TEMPLATES:
+            service.precompile(template)
+
+        assert len(service._compiled) == len(DEFAULT_TEMPLATES)
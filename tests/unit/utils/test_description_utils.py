@@ -1,149 +1,154 @@
 """Unit tests for description_utils"""
 
-from app.utils.description_utils import strip_html, process_description
+import pytest
 
 
-class TestStripHtml:
-    """Tests for strip_html function"""
-
-    def test_empty_string(self):
-        """Test empty string returns empty"""
-        assert strip_html("") == ""
-
-    def test_none_returns_empty(self):
-        """Test None-like falsy value returns empty"""
-        assert strip_html(None) == ""
-
-    def test_simple_html(self):
-        """Test stripping simple HTML tags"""
-        html = "<p>Hello World</p>"
-        result = strip_html(html)
-        assert "Hello World" in result
+@pytest.fixture(scope="session")
+def description_utils():
+    """Import app.utils.description_utils (and BeautifulSoup) on first use only"""
+    from app.utils import description_utils
 
-    def test_nested_html(self):
-        """Test stripping nested HTML"""
-        html = "<div><p>Nested <strong>content</strong></p></div>"
-        result = strip_html(html)
-        assert "Nested" in result
-        assert "content" in result
-        assert "<" not in result
+    # Pay the parser's first-call setup here rather than in the first test
+    description_utils.strip_html("<p></p>")
+    return description_utils
 
-    def test_removes_script_tags(self):
-        """Test script tags are removed entirely"""
-        html = "<p>Text</p><script>alert('xss')</script><p>More</p>"
-        result = strip_html(html)
-        assert "alert" not in result
-        assert "Text" in result
-        assert "More" in result
 
-    def test_removes_style_tags(self):
-        """Test style tags are removed entirely"""
-        html = "<style>.class { color: red; }</style><p>Content</p>"
-        result = strip_html(html)
-        assert "color" not in result
-        assert "Content" in result
-
-    def test_removes_head_meta_link(self):
-        """Test head, meta, link tags are removed"""
-        html = "<head><meta charset='utf-8'><link rel='stylesheet'></head><body>Body</body>"
-        result = strip_html(html)
-        assert "charset" not in result
-        assert "stylesheet" not in result
-        assert "Body" in result
+class TestStripHtml:
+    """Tests for strip_html function"""
 
-    def test_preserves_text_content(self):
-        """Test text content is preserved"""
-        html = "<div>First</div><div>Second</div>"
-        result = strip_html(html)
-        assert "First" in result
-        assert "Second" in result
+    @pytest.mark.parametrize(
+        "html,expected_in,expected_not_in",
+        [
+            pytest.param("<p>Hello World</p>", ["Hello World"], ["<"], id="simple"),
+            pytest.param(
+                "<div><p>Nested <strong>content</strong></p></div>",
+                ["Nested", "content"],
+                ["<"],
+                id="nested",
+            ),
+            pytest.param(
+                "<p>Text</p><script>alert('xss')</script><p>More</p>",
+                ["Text", "More"],
+                ["alert"],
+                id="removes_script",
+            ),
+            pytest.param(
+                "<style>.class { color: red; }</style><p>Content</p>",
+                ["Content"],
+                ["color"],
+                id="removes_style",
+            ),
+            pytest.param(
+                "<head><meta charset='utf-8'><link rel='stylesheet'></head><body>Body</body>",
+                ["Body"],
+                ["charset", "stylesheet"],
+                id="removes_head_meta_link",
+            ),
+            pytest.param(
+                "<div>First</div><div>Second</div>",
+                ["First", "Second"],
+                [],
+                id="preserves_text",
+            ),
+        ],
+    )
+    def test_strip_html(self, description_utils, html, expected_in, expected_not_in):
+        """Test tags are stripped and text content is kept"""
+        # Exact whitespace depends on the parser (lxml or html.parser)
+        result = description_utils.strip_html(html)
+
+        for text in expected_in:
+            assert text in result
+        for text in expected_not_in:
+            assert text not in result
+
+    @pytest.mark.parametrize("html", ["", None], ids=["empty", "none"])
+    def test_falsy_returns_empty(self, description_utils, html):
+        """Test empty or None input returns empty"""
+        assert description_utils.strip_html(html) == ""
 
 
 class TestProcessDescription:
     """Tests for process_description function"""
 
-    def test_empty_description(self):
-        """Test empty description returns empty"""
-        assert process_description("") == ""
-
-    def test_none_mode(self):
-        """Test none mode returns empty"""
-        assert process_description("Some content", mode="none") == ""
-
-    def test_full_mode_preserves_html(self):
-        """Test full mode preserves original content"""
-        html = "<p>Hello</p>"
-        result = process_description(html, mode="full")
-        assert result == "<p>Hello</p>"
-
-    def test_clean_mode_strips_html(self):
-        """Test clean mode strips HTML"""
-        html = "<p>Hello <strong>World</strong></p>"
-        result = process_description(html, mode="clean")
-        assert "<" not in result
-        assert "Hello" in result
-        assert "World" in result
-
-    def test_clean_mode_normalizes_whitespace(self):
-        """Test clean mode normalizes whitespace"""
-        html = "<p>Line1</p>\r\n\r\n\r\n<p>Line2</p>"
-        result = process_description(html, mode="clean")
-        # Should not have excessive newlines
-        assert "\r" not in result
-
-    def test_truncation_with_max_length(self):
-        """Test truncation at word boundary"""
-        text = "This is a long description that should be truncated"
-        result = process_description(text, mode="full", max_length=20)
-        assert len(result) <= 23  # 20 + "..."
-        assert result.endswith("...")
-
-    def test_truncation_clean_mode(self):
-        """Test truncation in clean mode"""
-        html = "<p>This is a long description that should be truncated</p>"
-        result = process_description(html, mode="clean", max_length=20)
-        assert result.endswith("...")
-
-    def test_no_truncation_when_short(self):
-        """Test no truncation when content is short"""
-        text = "Short"
-        result = process_description(text, mode="full", max_length=100)
-        assert result == "Short"
-        assert "..." not in result
-
-    def test_clean_mode_collapses_spaces(self):
-        """Test clean mode collapses multiple spaces"""
-        html = "<p>Word1    Word2</p>"
-        result = process_description(html, mode="clean")
-        assert "    " not in result
-
-    def test_clean_mode_strips_empty_lines(self):
-        """Test clean mode removes empty lines"""
-        text = "Line1\n\n\n\nLine2"
-        result = process_description(text, mode="clean")
-        # Should have at most 2 consecutive newlines
-        assert "\n\n\n" not in result
-
-    def test_clean_mode_escapes_hash_symbols(self):
-        """Test clean mode adds space after # to prevent Tana supertag creation"""
-        text = "Check out #todo and #important items"
-        result = process_description(text, mode="clean")
-        assert "#todo" not in result
-        assert "#important" not in result
-        assert "# todo" in result
-        assert "# important" in result
-
-    def test_clean_mode_escapes_hash_from_html(self):
-        """Test clean mode escapes # from HTML content"""
-        html = "<p>Task: #todo complete the #project</p>"
-        result = process_description(html, mode="clean")
-        assert "#todo" not in result
-        assert "#project" not in result
-        assert "# todo" in result
-        assert "# project" in result
-
-    def test_full_mode_preserves_hash_symbols(self):
-        """Test full mode preserves # symbols"""
-        text = "Check #todo"
-        result = process_description(text, mode="full")
-        assert "#todo" in result
+    @pytest.mark.parametrize(
+        "text,mode,max_length,expected",
+        [
+            pytest.param("", "full", None, "", id="empty"),
+            pytest.param("Some content", "none", None, "", id="none_mode"),
+            pytest.param(
+                "<p>Hello</p>", "full", None, "<p>Hello</p>", id="full_keeps_html"
+            ),
+            pytest.param(
+                "<p>Hello <strong>World</strong></p>",
+                "clean",
+                None,
+                "Hello World",
+                id="clean_strips_html",
+            ),
+            pytest.param(
+                "<p>Line1</p>\r\n\r\n\r\n<p>Line2</p>",
+                "clean",
+                None,
+                "Line1 Line2",
+                id="clean_normalizes_crlf",
+            ),
+            pytest.param(
+                "Line1\n\n\n\nLine2",
+                "clean",
+                None,
+                "Line1 Line2",
+                id="clean_joins_lines",
+            ),
+            pytest.param(
+                "<p>Word1    Word2</p>",
+                "clean",
+                None,
+                "Word1 Word2",
+                id="clean_collapses_spaces",
+            ),
+            # Truncation happens at a word boundary
+            pytest.param(
+                "This is a long description that should be truncated",
+                "full",
+                20,
+                "This is a long...",
+                id="truncate_full",
+            ),
+            pytest.param(
+                "<p>This is a long description that should be truncated</p>",
+                "clean",
+                20,
+                "This is a long...",
+                id="truncate_clean",
+            ),
+            pytest.param("Short", "full", 100, "Short", id="no_truncation_when_short"),
+            # Clean mode adds a space after # to prevent Tana supertag creation
+            pytest.param(
+                "Check out #todo and #important items",
+                "clean",
+                None,
+                "Check out # todo and # important items",
+                id="clean_escapes_hash",
+            ),
+            pytest.param(
+                "<p>Task: #todo complete the #project</p>",
+                "clean",
+                None,
+                "Task: # todo complete the # project",
+                id="clean_escapes_hash_from_html",
+            ),
+            pytest.param(
+                "Check #todo", "full", None, "Check #todo", id="full_keeps_hash"
+            ),
+        ],
+    )
+    def test_process_description(
+        self, description_utils, text, mode, max_length, expected
+    ):
+        """Test each mode's output, with optional truncation"""
+        result = description_utils.process_description(
+            text, mode=mode, max_length=max_length
+        )
+
+        assert result == expected
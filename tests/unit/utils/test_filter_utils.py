@@ -1,11 +1,14 @@
 """Unit tests for filter_utils module"""
 
+from collections import OrderedDict
+
 import pytest
 from app.utils.filter_utils import (
     get_nested_value,
     matches_filter,
     parse_filter_expression,
     apply_filter,
+    compile_filter,
 )
 
 
@@ -38,11 +41,23 @@ class TestGetNestedValue:
         obj = {"from": "not-a-dict"}
         assert get_nested_value(obj, "from.emailAddress.name") is None
 
+    def test_dict_subclass_intermediate(self):
+        """Should walk through dict subclasses as well as plain dicts"""
+        obj = {"from": OrderedDict(emailAddress={"name": "John"})}
+        assert get_nested_value(obj, "from.emailAddress.name") == "John"
+
     def test_deeply_nested(self):
         """Should handle deeply nested paths"""
         obj = {"a": {"b": {"c": {"d": "value"}}}}
         assert get_nested_value(obj, "a.b.c.d") == "value"
 
+    def test_repeated_path_reuses_split(self):
+        """Should resolve the same path consistently across objects"""
+        first = {"from": {"emailAddress": {"name": "John"}}}
+        second = {"from": {"emailAddress": {"name": "Jane"}}}
+        assert get_nested_value(first, "from.emailAddress.name") == "John"
+        assert get_nested_value(second, "from.emailAddress.name") == "Jane"
+
 
 @pytest.mark.unit
 class TestMatchesFilter:
@@ -138,6 +153,12 @@ class TestMatchesFilter:
         assert matches_filter(item, "receivedDateTime", "gt", "2025-10-01") is True
         assert matches_filter(item, "receivedDateTime", "lt", "2025-10-10") is True
 
+    def test_gt_numeric_string(self):
+        """Should compare numeric strings as numbers, not text"""
+        item = {"size": "100"}
+        assert matches_filter(item, "size", "gt", "50") is True
+        assert matches_filter(item, "size", "lt", "50") is False
+
     # Exists operator tests
     def test_exists_true(self):
         """Should match when field exists and has value"""
@@ -180,6 +201,24 @@ class TestMatchesFilter:
         item = {"categories": ["Work"]}
         assert matches_filter(item, "categories", "startswith", "W") is False
 
+    def test_condition_compiled_once(self, monkeypatch):
+        """Should reuse the compiled condition across calls"""
+        from app.utils import filter_utils
+
+        filter_utils._compile_condition.cache_clear()
+        calls = []
+        compile_test = filter_utils._compile_test
+        monkeypatch.setattr(
+            filter_utils,
+            "_compile_test",
+            lambda *args: calls.append(args) or compile_test(*args),
+        )
+
+        for subject in ("Weekly sync", "Lunch", "Sync notes"):
+            matches_filter({"subject": subject}, "subject", "contains", "sync")
+
+        assert len(calls) == 1
+
 
 @pytest.mark.unit
 class TestParseFilterExpression:
@@ -188,49 +227,152 @@ class TestParseFilterExpression:
     def test_simple_field_value(self):
         """Should parse field:value as eq operator"""
         result = parse_filter_expression("categories:tana")
-        assert result == [("categories", "eq", "tana")]
+        assert result == (("categories", "eq", "tana"),)
 
     def test_explicit_operator(self):
         """Should parse field:operator:value"""
         result = parse_filter_expression("isRead:eq:false")
-        assert result == [("isRead", "eq", "false")]
+        assert result == (("isRead", "eq", "false"),)
 
     def test_nested_field(self):
         """Should handle nested field paths"""
         result = parse_filter_expression("from.emailAddress.address:contains:@sap.com")
-        assert result == [("from.emailAddress.address", "contains", "@sap.com")]
+        assert result == (("from.emailAddress.address", "contains", "@sap.com"),)
 
     def test_multiple_conditions(self):
         """Should parse comma-separated conditions"""
         result = parse_filter_expression("categories:tana,isRead:eq:false")
-        assert result == [
+        assert result == (
             ("categories", "eq", "tana"),
             ("isRead", "eq", "false"),
-        ]
+        )
 
     def test_value_with_colons(self):
         """Should handle values containing colons"""
         result = parse_filter_expression("webLink:contains:https://example.com")
-        assert result == [("webLink", "contains", "https://example.com")]
+        assert result == (("webLink", "contains", "https://example.com"),)
 
     def test_empty_expression(self):
-        """Should return empty list for empty expression"""
+        """Should return no conditions for empty expression"""
         result = parse_filter_expression("")
-        assert result == []
+        assert result == ()
 
     def test_whitespace_handling(self):
         """Should strip whitespace from parts"""
         result = parse_filter_expression(" categories : eq : tana ")
-        assert result == [("categories", "eq", "tana")]
+        assert result == (("categories", "eq", "tana"),)
 
     def test_empty_parts_ignored(self):
         """Should ignore empty parts"""
         result = parse_filter_expression("categories:tana,,isRead:false")
-        assert result == [
+        assert result == (
             ("categories", "eq", "tana"),
             ("isRead", "eq", "false"),
+        )
+
+    def test_result_is_cached(self):
+        """Should return the same parsed conditions for a repeated expression"""
+        first = parse_filter_expression("categories:tana,isRead:false")
+        assert parse_filter_expression("categories:tana,isRead:false") is first
+
+
+@pytest.mark.unit
+class TestCompileFilter:
+    """Tests for compile_filter function"""
+
+    def test_returns_predicate(self):
+        """Should compile an expression into a callable predicate"""
+        predicate = compile_filter("importance:high")
+        assert predicate({"importance": "HIGH"}) is True
+        assert predicate({"importance": "low"}) is False
+
+    def test_and_conditions(self):
+        """Should require every condition by default"""
+        predicate = compile_filter("isRead:false,importance:high")
+        assert predicate({"isRead": False, "importance": "high"}) is True
+        assert predicate({"isRead": True, "importance": "high"}) is False
+
+    def test_or_conditions(self):
+        """Should require any condition when match_all=False"""
+        predicate = compile_filter("isRead:false,importance:high", match_all=False)
+        assert predicate({"isRead": True, "importance": "high"}) is True
+        assert predicate({"isRead": True, "importance": "low"}) is False
+
+    def test_cheap_conditions_evaluated_first(self):
+        """Should test eq before contains and stop at the first failure"""
+
+        class Unreadable:
+            def __str__(self):
+                raise AssertionError("contains should not have been evaluated")
+
+        predicate = compile_filter("subject:contains:x,importance:eq:high")
+        assert predicate({"subject": Unreadable(), "importance": "low"}) is False
+
+    def test_shared_field_lowered_once(self):
+        """Should lowercase a field once when several conditions read it"""
+
+        class Subject:
+            calls = 0
+
+            def __str__(self):
+                Subject.calls += 1
+                return "RE: Team Meeting"
+
+        predicate = compile_filter("subject:contains:team,subject:ne:lunch")
+        assert predicate({"subject": Subject()}) is True
+        assert Subject.calls == 1
+
+    @pytest.mark.parametrize(
+        "categories,expected",
+        [
+            (["Home", "Work"], True),
+            (["Personal"], False),
+            ([{"name": "Work"}], False),  # unhashable entries fall back to a scan
+        ],
+    )
+    def test_list_membership_shared_across_conditions(self, categories, expected):
+        """Should match several eq conditions against one list field"""
+        predicate = compile_filter("categories:Work,categories:Home", match_all=False)
+        assert predicate({"categories": categories}) is expected
+
+    @pytest.mark.parametrize(
+        "expression,expected",
+        [
+            ("subject:startswith:re: TEAM", True),
+            ("subject:startswith:re: lunch", False),
+            ("subject:endswith:MEETING", True),
+            ("subject:endswith:lunch", False),
+            ("subject:endswith:much longer than the subject", False),
+        ],
+    )
+    def test_affix_operators(self, expression, expected):
+        """Should compare prefixes/suffixes case-insensitively"""
+        predicate = compile_filter(expression)
+        assert predicate({"subject": "RE: Team Meeting"}) is expected
+
+    @pytest.mark.parametrize(
+        "subject,expression",
+        [
+            ("ΣΥΣΤΗΜΑ ΕΛΕΓΧΟΥ", "subject:startswith:συσ"),
+            ("ΟΔΟΣ", "subject:endswith:ς"),
+            ("ΟΔΟΣ", "subject:endswith:ΟΔΟΣ"),
+        ],
+    )
+    def test_affix_operators_non_ascii(self, subject, expression):
+        """Should lowercase the whole value (final sigma is context dependent)"""
+        assert apply_filter([{"subject": subject}], expression) == [
+            {"subject": subject}
         ]
 
+    def test_empty_expression_returns_none(self):
+        """Should return None when there are no conditions"""
+        assert compile_filter(" , ") is None
+
+    def test_compiled_filter_is_cached(self):
+        """Should reuse the compiled predicate for the same expression"""
+        assert compile_filter("categories:Work") is compile_filter("categories:Work")
+        assert compile_filter("a:1,b:2") is not compile_filter("a:1,b:2", False)
+
 
 @pytest.mark.unit
 class TestApplyFilter:
@@ -293,11 +435,35 @@ class TestApplyFilter:
         result = apply_filter(items, None)
         assert result == items
 
+    @pytest.mark.parametrize("filter_expr", [None, "", " , "])
+    def test_no_conditions_returns_same_list(self, filter_expr):
+        """Should hand back the input list itself when nothing is filtered"""
+        items = [{"id": "1"}, {"id": "2"}]
+        assert apply_filter(items, filter_expr) is items
+
     def test_empty_items_returns_empty(self):
         """Should return empty list when items is empty"""
         result = apply_filter([], "categories:Work")
         assert result == []
 
+    def test_single_eq_fast_path(self):
+        """Should match a single top-level eq on string, list and other values"""
+        items = [
+            {"id": "1", "field": "Work"},
+            {"id": "2", "field": ["Home", "Work"]},
+            {"id": "3", "field": ["work"]},  # list membership is case-sensitive
+            {"id": "4", "field": None},
+            {"id": "5"},
+        ]
+        result = apply_filter(items, "field:WORK")
+        assert [item["id"] for item in result] == ["1"]
+
+        result = apply_filter(items, "field:Work")
+        assert [item["id"] for item in result] == ["1", "2"]
+
+        flags = [{"id": "1", "isRead": False}, {"id": "2", "isRead": True}]
+        assert apply_filter(flags, "isRead:false") == [flags[0]]
+
     def test_no_matching_items(self):
         """Should return empty list when no items match"""
         items = [
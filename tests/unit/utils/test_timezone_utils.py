@@ -1,16 +1,34 @@
 """Unit tests for timezone utilities"""
 
-from unittest.mock import patch, MagicMock
-from datetime import datetime, timezone
+from unittest.mock import patch
+from datetime import datetime, timedelta, timezone
+
+import pytest
 
 from app.utils.timezone_utils import (
+    clear_timezone_cache,
     get_system_timezone_name,
     format_datetime_for_graph,
     convert_to_local_timezone,
     format_datetime_local,
+    get_local_timezone,
 )
 
 
+def _set_utc_offset(mock_datetime, **offset):
+    """Make the mocked local clock report the given UTC offset"""
+    local_now = mock_datetime.now.return_value.astimezone.return_value
+    local_now.utcoffset.return_value = timedelta(**offset)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_timezone_cache():
+    """Detect the timezone again in every test, so mocked clocks take effect"""
+    clear_timezone_cache()
+    yield
+    clear_timezone_cache()
+
+
 class TestGetSystemTimezoneName:
     """Tests for get_system_timezone_name function"""
 
@@ -23,12 +41,7 @@ class TestGetSystemTimezoneName:
     @patch("app.utils.timezone_utils.datetime")
     def test_utc_offset_zero(self, mock_datetime):
         """Test UTC timezone detection"""
-        mock_datetime.now.side_effect = [
-            datetime(2025, 10, 5, 12, 0, 0),  # local
-            MagicMock(
-                replace=MagicMock(return_value=datetime(2025, 10, 5, 12, 0, 0))
-            ),  # utc
-        ]
+        _set_utc_offset(mock_datetime, hours=0)
 
         result = get_system_timezone_name()
         assert result == "UTC"
@@ -36,12 +49,7 @@ class TestGetSystemTimezoneName:
     @patch("app.utils.timezone_utils.datetime")
     def test_utc_plus_1(self, mock_datetime):
         """Test UTC+1 timezone detection"""
-        mock_datetime.now.side_effect = [
-            datetime(2025, 10, 5, 13, 0, 0),  # local (UTC+1)
-            MagicMock(
-                replace=MagicMock(return_value=datetime(2025, 10, 5, 12, 0, 0))
-            ),  # utc
-        ]
+        _set_utc_offset(mock_datetime, hours=1)
 
         result = get_system_timezone_name()
         assert result == "W. Europe Standard Time"
@@ -49,12 +57,7 @@ class TestGetSystemTimezoneName:
     @patch("app.utils.timezone_utils.datetime")
     def test_utc_plus_2(self, mock_datetime):
         """Test UTC+2 timezone detection (Central European)"""
-        mock_datetime.now.side_effect = [
-            datetime(2025, 10, 5, 14, 0, 0),  # local (UTC+2)
-            MagicMock(
-                replace=MagicMock(return_value=datetime(2025, 10, 5, 12, 0, 0))
-            ),  # utc
-        ]
+        _set_utc_offset(mock_datetime, hours=2)
 
         result = get_system_timezone_name()
         assert result == "Central European Standard Time"
@@ -62,12 +65,7 @@ class TestGetSystemTimezoneName:
     @patch("app.utils.timezone_utils.datetime")
     def test_utc_minus_5(self, mock_datetime):
         """Test UTC-5 timezone detection (Eastern US)"""
-        mock_datetime.now.side_effect = [
-            datetime(2025, 10, 5, 7, 0, 0),  # local (UTC-5)
-            MagicMock(
-                replace=MagicMock(return_value=datetime(2025, 10, 5, 12, 0, 0))
-            ),  # utc
-        ]
+        _set_utc_offset(mock_datetime, hours=-5)
 
         result = get_system_timezone_name()
         assert result == "Eastern Standard Time"
@@ -75,12 +73,7 @@ class TestGetSystemTimezoneName:
     @patch("app.utils.timezone_utils.datetime")
     def test_utc_minus_8(self, mock_datetime):
         """Test UTC-8 timezone detection (Pacific US)"""
-        mock_datetime.now.side_effect = [
-            datetime(2025, 10, 5, 4, 0, 0),  # local (UTC-8)
-            MagicMock(
-                replace=MagicMock(return_value=datetime(2025, 10, 5, 12, 0, 0))
-            ),  # utc
-        ]
+        _set_utc_offset(mock_datetime, hours=-8)
 
         result = get_system_timezone_name()
         assert result == "Pacific Standard Time"
@@ -88,12 +81,7 @@ class TestGetSystemTimezoneName:
     @patch("app.utils.timezone_utils.datetime")
     def test_utc_plus_5_5_india(self, mock_datetime):
         """Test UTC+5:30 timezone detection (India)"""
-        mock_datetime.now.side_effect = [
-            datetime(2025, 10, 5, 17, 30, 0),  # local (UTC+5:30)
-            MagicMock(
-                replace=MagicMock(return_value=datetime(2025, 10, 5, 12, 0, 0))
-            ),  # utc
-        ]
+        _set_utc_offset(mock_datetime, hours=5, minutes=30)
 
         result = get_system_timezone_name()
         assert result == "India Standard Time"
@@ -102,16 +90,42 @@ class TestGetSystemTimezoneName:
     def test_unknown_offset_returns_utc(self, mock_datetime):
         """Test unknown offset falls back to UTC"""
         # UTC+13 is not in the timezone map
-        mock_datetime.now.side_effect = [
-            datetime(2025, 10, 6, 1, 0, 0),  # local (UTC+13)
-            MagicMock(
-                replace=MagicMock(return_value=datetime(2025, 10, 5, 12, 0, 0))
-            ),  # utc
-        ]
+        _set_utc_offset(mock_datetime, hours=13)
 
         result = get_system_timezone_name()
         assert result == "UTC"
 
+    @patch("app.utils.timezone_utils.datetime")
+    def test_result_cached_within_half_hour(self, mock_datetime):
+        """Test detection runs once while the half hour is unchanged"""
+        _set_utc_offset(mock_datetime, hours=1)
+
+        with patch("app.utils.timezone_utils.time.time", return_value=1800 * 10):
+            assert get_system_timezone_name() == "W. Europe Standard Time"
+            assert get_system_timezone_name() == "W. Europe Standard Time"
+        assert mock_datetime.now.call_count == 1
+
+    @patch("app.utils.timezone_utils.datetime")
+    def test_cache_expires_at_half_hour(self, mock_datetime):
+        """Test a DST change at :30 UTC is picked up by the next slot"""
+        _set_utc_offset(mock_datetime, hours=9, minutes=30)
+        with patch("app.utils.timezone_utils.time.time", return_value=1800 * 10):
+            assert get_system_timezone_name() == "AUS Central Standard Time"
+
+        _set_utc_offset(mock_datetime, hours=10)
+        with patch("app.utils.timezone_utils.time.time", return_value=1800 * 11):
+            assert get_system_timezone_name() == "AUS Eastern Standard Time"
+
+    @patch("app.utils.timezone_utils.datetime")
+    def test_fallback_not_cached(self, mock_datetime):
+        """Test a failed detection is retried on the next call"""
+        mock_datetime.now.side_effect = Exception("Test error")
+        assert get_system_timezone_name() == "UTC"
+
+        mock_datetime.now.side_effect = None
+        _set_utc_offset(mock_datetime, hours=1)
+        assert get_system_timezone_name() == "W. Europe Standard Time"
+
     @patch("app.utils.timezone_utils.datetime")
     def test_exception_returns_utc(self, mock_datetime):
         """Test exception handling returns UTC"""
@@ -142,6 +156,18 @@ class TestFormatDatetimeForGraph:
         result = format_datetime_for_graph(dt)
         assert result == "2025-10-05T23:59:59"
 
+    def test_drops_microseconds(self):
+        """Test microseconds are not included"""
+        dt = datetime(2025, 10, 5, 14, 30, 45, 123456)
+        result = format_datetime_for_graph(dt)
+        assert result == "2025-10-05T14:30:45"
+
+    def test_drops_timezone(self):
+        """Test aware datetimes are formatted without an offset"""
+        dt = datetime(2025, 10, 5, 14, 30, 45, tzinfo=timezone.utc)
+        result = format_datetime_for_graph(dt)
+        assert result == "2025-10-05T14:30:45"
+
 
 class TestConvertToLocalTimezone:
     """Tests for convert_to_local_timezone function"""
@@ -166,6 +192,27 @@ class TestConvertToLocalTimezone:
         assert result.tzinfo is not None
 
 
+class TestGetLocalTimezone:
+    """Tests for get_local_timezone function"""
+
+    @patch("app.utils.timezone_utils.datetime")
+    def test_uses_local_offset(self, mock_datetime):
+        """Test timezone carries the local UTC offset"""
+        _set_utc_offset(mock_datetime, hours=5, minutes=30)
+
+        result = get_local_timezone()
+        assert result.utcoffset(None) == timedelta(hours=5, minutes=30)
+
+    @patch("app.utils.timezone_utils.datetime")
+    def test_result_cached_within_half_hour(self, mock_datetime):
+        """Test the offset is read once while the half hour is unchanged"""
+        _set_utc_offset(mock_datetime, hours=1)
+
+        with patch("app.utils.timezone_utils.time.time", return_value=1800 * 10):
+            assert get_local_timezone() is get_local_timezone()
+        assert mock_datetime.now.call_count == 1
+
+
 class TestFormatDatetimeLocal:
     """Tests for format_datetime_local function"""
 